@@ -0,0 +1,65 @@
+import logging
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from ledfx.effects import Effect
+from ledfx.effects.blade_power_plus import BladePowerPlus
+from ledfx.effects.block_reflections import BlockReflections
+from ledfx.effects.crawler import Crawler
+from ledfx.effects.energy2 import Energy2
+from ledfx.effects.fire import Fire
+from ledfx.effects.glitch import Glitch
+from ledfx.effects.lava_lamp import Lavalamp
+from ledfx.effects.marching import Marching
+from ledfx.effects.melt import Melt
+
+# Times the render of the HSV family of effects, which all go through
+# HSVEffect.render. Run before and after touching the render path:
+#   python benchmark_effects.py [pixel_count ...]
+
+# effects to time
+EFFECTS = (
+    BladePowerPlus,
+    BlockReflections,
+    Crawler,
+    Energy2,
+    Fire,
+    Glitch,
+    Lavalamp,
+    Marching,
+    Melt,
+)
+# strip lengths to time each effect at
+PIXEL_COUNTS = (150, 1500)
+# frames rendered per timing
+FRAMES = 500
+
+logging.disable(logging.INFO)
+
+
+def time_effect(effect_class, pixel_count):
+    effect = effect_class(ledfx=None, config={})
+    # Activate without subscribing to an audio source
+    Effect.activate(effect, SimpleNamespace(pixel_count=pixel_count))
+    effect.audio = None
+    effect.render()
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        effect.render()
+    return (time.perf_counter() - start) / FRAMES
+
+
+if __name__ == "__main__":
+    pixel_counts = [int(arg) for arg in sys.argv[1:]] or PIXEL_COUNTS
+    print(f"{'effect':<20}" + "".join(f"{n:>12}" for n in pixel_counts))
+    for effect_class in EFFECTS:
+        timings = [time_effect(effect_class, n) for n in pixel_counts]
+        print(
+            f"{effect_class.NAME:<20}"
+            + "".join(f"{t * 1000:>9.3f} ms" for t in timings)
+        )
+    print(f"(mean render time over {FRAMES} frames, numpy {np.__version__})")
@@ -0,0 +1,37 @@
+import json
+
+from ledfx.api import RestEndpoint
+from ledfx.devices import Device
+from ledfx.effects import Effect
+from ledfx.integrations import Integration
+from ledfx.utils import REGISTRY_MANIFEST_FILE, build_registry_manifest_entry
+
+# Writes the registry manifest that lets LedFx import registry modules only
+# when their types are used. Run after changing any effect, device,
+# integration or api module, as LedFx imports every module of a registry
+# whose manifest no longer matches its sources:
+#   python generate_registry_manifest.py
+
+# registry packages and the base class each registers to
+REGISTRIES = {
+    "ledfx.api": RestEndpoint,
+    "ledfx.devices": Device,
+    "ledfx.effects": Effect,
+    "ledfx.integrations": Integration,
+}
+
+
+def main():
+    manifest = {
+        package: build_registry_manifest_entry(package, cls)
+        for package, cls in REGISTRIES.items()
+    }
+    with open(REGISTRY_MANIFEST_FILE, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=4, sort_keys=True)
+        file.write("\n")
+    for package, entry in manifest.items():
+        print(f"{package}: {len(entry['types'])} types")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ For non-development purposes run:
 import argparse
 import importlib
 import logging
+import multiprocessing
 import os
 import subprocess
 import sys
@@ -42,6 +43,12 @@ try:
 except ImportError:
     have_updater = False
 
+# Imports can only be timed when timing starts before LedFx is imported
+if "--profile-startup" in sys.argv:
+    from ledfx import startup_profile
+
+    startup_profile.start()
+
 import ledfx.config as config_helpers
 from ledfx.consts import (
     PROJECT_NAME,
@@ -217,6 +224,19 @@ def parse_args():
         action="store_true",
         help="Disable automated updates and sentry crash logger",
     )
+    parser.add_argument(
+        "--config-storage",
+        dest="config_storage",
+        choices=["json", "sqlite"],
+        help="Move the configuration to a JSON file, or to an SQLite store that only rewrites what changed",
+        default=None,
+    )
+    parser.add_argument(
+        "--profile-startup",
+        dest="profile_startup",
+        action="store_true",
+        help="Report the time taken by each import and startup stage",
+    )
     parser.add_argument(
         "--sentry-crash-test",
         dest="sentry_test",
@@ -305,11 +325,16 @@ def update_ledfx(icon=None):
 
 def main():
     """Main entry point allowing external calls"""
+    # Render workers are spawned from this entry point in frozen builds
+    multiprocessing.freeze_support()
     args = parse_args()
     config_helpers.ensure_config_directory(args.config)
     setup_logging(args.loglevel, config_dir=args.config)
     config_helpers.load_logger()
 
+    if args.config_storage:
+        config_helpers.set_config_storage(args.config, args.config_storage)
+
     # Set some process priority optimisations
     if have_psutil:
         p = psutil.Process(os.getpid())
@@ -5,6 +5,7 @@ from aiohttp import web
 
 from ledfx.api import RestEndpoint
 from ledfx.config import save_config
+from ledfx.presets import get_presets, ledfx_presets
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,8 +27,8 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=400)
 
-        if effect_id in self._ledfx.config["ledfx_presets"].keys():
-            default = self._ledfx.config["ledfx_presets"][effect_id]
+        if effect_id in ledfx_presets.keys():
+            default = ledfx_presets[effect_id]
         else:
             default = {}
 
@@ -74,6 +75,7 @@ class PresetsEndpoint(RestEndpoint):
                 ),
             }
             return web.json_response(data=response, status=400)
+        presets = get_presets(self._ledfx.config, category)
 
         if effect_id is None:
             response = {
@@ -82,7 +84,7 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=400)
 
-        if effect_id not in self._ledfx.config[category].keys():
+        if effect_id not in presets.keys():
             response = {
                 "status": "failed",
                 "reason": "Effect {} does not exist in category {}".format(
@@ -107,7 +109,7 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=400)
 
-        if preset_id not in self._ledfx.config[category][effect_id].keys():
+        if preset_id not in presets[effect_id].keys():
             response = {
                 "status": "failed",
                 "reason": "Preset {} does not exist for effect {} in category {}".format(
@@ -124,7 +126,7 @@ class PresetsEndpoint(RestEndpoint):
             return web.json_response(data=response, status=400)
 
         # Update and save config
-        self._ledfx.config[category][effect_id][preset_id]["name"] = name
+        presets[effect_id][preset_id]["name"] = name
         save_config(
             config=self._ledfx.config,
             config_dir=self._ledfx.config_dir,
@@ -161,6 +163,7 @@ class PresetsEndpoint(RestEndpoint):
                 ),
             }
             return web.json_response(data=response, status=400)
+        presets = get_presets(self._ledfx.config, category)
 
         if effect_id is None:
             response = {
@@ -178,7 +181,7 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=400)
 
-        if effect_id not in self._ledfx.config[category].keys():
+        if effect_id not in presets.keys():
             response = {
                 "status": "failed",
                 "reason": "Effect {} does not exist in category {}".format(
@@ -194,7 +197,7 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=400)
 
-        if preset_id not in self._ledfx.config[category][effect_id].keys():
+        if preset_id not in presets[effect_id].keys():
             response = {
                 "status": "failed",
                 "reason": "Preset {} does not exist for effect {} in category {}".format(
@@ -204,7 +207,7 @@ class PresetsEndpoint(RestEndpoint):
             return web.json_response(data=response, status=400)
 
         # Delete the preset from configuration
-        del self._ledfx.config[category][effect_id][preset_id]
+        del presets[effect_id][preset_id]
 
         # Save the config
         save_config(
@@ -5,7 +5,6 @@ from aiohttp import web
 
 from ledfx.api import RestEndpoint
 from ledfx.config import save_config
-from ledfx.events import SceneActivatedEvent
 from ledfx.utils import generate_id
 
 _LOGGER = logging.getLogger(__name__)
@@ -126,30 +125,7 @@ class ScenesEndpoint(RestEndpoint):
             return web.json_response(data=response, status=200)
 
         if action == "activate":
-            for virtual in self._ledfx.virtuals.values():
-                # Check virtual is in scene, make no changes if it isn't
-                if virtual.id not in scene["virtuals"].keys():
-                    # _LOGGER.info(
-                    #     ("virtual with id {} has no data in scene {}").format(
-                    #         virtual.id, scene_id
-                    #     )
-                    # )
-                    continue
-
-                # Set effect of virtual to that saved in the scene,
-                # clear active effect of virtual if no effect in scene
-                if scene["virtuals"][virtual.id]:
-                    # Create the effect and add it to the virtual
-                    effect = self._ledfx.effects.create(
-                        ledfx=self._ledfx,
-                        type=scene["virtuals"][virtual.id]["type"],
-                        config=scene["virtuals"][virtual.id]["config"],
-                    )
-                    virtual.set_effect(effect)
-                else:
-                    virtual.clear_effect()
-
-            self._ledfx.events.fire_event(SceneActivatedEvent(scene_id))
+            self._ledfx.scenes.activate(scene_id)
             response = {
                 "status": "success",
                 "payload": {
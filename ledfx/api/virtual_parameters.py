@@ -0,0 +1,94 @@
+import logging
+from json import JSONDecodeError
+
+from aiohttp import web
+
+from ledfx.api import RestEndpoint
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ParametersEndpoint(RestEndpoint):
+    """
+    REST end-point for live parameters of a virtual's active effect: its
+    numeric config keys, which can be set quickly with only a range check
+    """
+
+    ENDPOINT_PATH = "/api/virtuals/{virtual_id}/parameters"
+
+    async def get(self, virtual_id) -> web.Response:
+        """
+        Get the live parameters of the active effect of a virtual
+        """
+        virtual = self._ledfx.virtuals.get(virtual_id)
+        if virtual is None:
+            response = {
+                "status": "failed",
+                "reason": f"Virtual with ID {virtual_id} not found",
+            }
+            return web.json_response(data=response, status=404)
+
+        effect = virtual.active_effect
+        if not hasattr(effect, "parameter_ranges"):
+            response = {
+                "status": "failed",
+                "reason": f"Virtual {virtual_id} has no active effect",
+            }
+            return web.json_response(data=response, status=400)
+
+        parameters = {}
+        for key, (coerce, valid_range) in effect.parameter_ranges().items():
+            parameters[key] = {
+                "type": coerce.__name__,
+                "min": valid_range.min,
+                "max": valid_range.max,
+                "value": effect.config.get(key),
+            }
+
+        response = {
+            "status": "success",
+            "effect": effect.type,
+            "parameters": parameters,
+        }
+        return web.json_response(data=response, status=200)
+
+    async def put(self, virtual_id, request) -> web.Response:
+        """
+        Set live parameters of the active effect of a virtual
+        """
+        virtual = self._ledfx.virtuals.get(virtual_id)
+        if virtual is None:
+            response = {
+                "status": "failed",
+                "reason": f"Virtual with ID {virtual_id} not found",
+            }
+            return web.json_response(data=response, status=404)
+
+        try:
+            data = await request.json()
+        except JSONDecodeError:
+            response = {
+                "status": "failed",
+                "reason": "JSON Decoding failed",
+            }
+            return web.json_response(data=response, status=400)
+
+        parameters = data.get("parameters")
+        if not isinstance(parameters, dict):
+            response = {
+                "status": "failed",
+                "reason": 'Required attribute "parameters" was not provided',
+            }
+            return web.json_response(data=response, status=400)
+
+        try:
+            parameters = virtual.set_effect_parameters(parameters)
+        except ValueError as msg:
+            response = {
+                "status": "failed",
+                "reason": str(msg),
+            }
+            return web.json_response(data=response, status=400)
+
+        response = {"status": "success", "parameters": parameters}
+        return web.json_response(data=response, status=200)
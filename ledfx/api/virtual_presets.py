@@ -5,6 +5,7 @@ from aiohttp import web
 
 from ledfx.api import RestEndpoint
 from ledfx.config import save_config
+from ledfx.presets import get_presets, ledfx_presets
 from ledfx.utils import generate_id
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,8 +36,8 @@ class VirtualPresetsEndpoint(RestEndpoint):
 
         effect_id = virtual.active_effect.type
 
-        if effect_id in self._ledfx.config["ledfx_presets"].keys():
-            default = self._ledfx.config["ledfx_presets"][effect_id]
+        if effect_id in ledfx_presets.keys():
+            default = ledfx_presets[effect_id]
         else:
             default = {}
 
@@ -116,6 +117,7 @@ class VirtualPresetsEndpoint(RestEndpoint):
             category = "ledfx_presets"
         else:
             category = "user_presets"
+        presets = get_presets(self._ledfx.config, category)
 
         if effect_id is None:
             response = {
@@ -124,7 +126,7 @@ class VirtualPresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=400)
 
-        if effect_id not in self._ledfx.config[category].keys():
+        if effect_id not in presets.keys():
             response = {
                 "status": "failed",
                 "reason": f"Effect {effect_id} does not exist in category {category}",
@@ -138,7 +140,7 @@ class VirtualPresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=400)
 
-        if preset_id not in self._ledfx.config[category][effect_id].keys():
+        if preset_id not in presets[effect_id].keys():
             response = {
                 "status": "failed",
                 "reason": "Preset {} does not exist for effect {} in category {}".format(
@@ -148,9 +150,7 @@ class VirtualPresetsEndpoint(RestEndpoint):
             return web.json_response(data=response, status=400)
 
         # Create the effect and add it to the virtual
-        effect_config = self._ledfx.config[category][effect_id][preset_id][
-            "config"
-        ]
+        effect_config = presets[effect_id][preset_id]["config"]
         effect = self._ledfx.effects.create(
             ledfx=self._ledfx, type=effect_id, config=effect_config
         )
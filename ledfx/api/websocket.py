@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import time
 from concurrent import futures
 
 import numpy as np
@@ -8,12 +9,27 @@ import voluptuous as vol
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.events import Event
-from ledfx.utils import empty_queue
+from ledfx.events import GRAPH_COMPRESSIONS, VISUALISATION_COMPRESSIONS, Event
+
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+except ImportError:
+    dumps = json.dumps
 
 _LOGGER = logging.getLogger(__name__)
 MAX_PENDING_MESSAGES = 256
 
+# Event types that can be streamed as binary, with their compressions.
+# The first compression listed is the default.
+BINARY_EVENT_COMPRESSIONS = {
+    Event.VISUALISATION_UPDATE: list(VISUALISATION_COMPRESSIONS),
+    Event.GRAPH_UPDATE: list(GRAPH_COMPRESSIONS),
+}
+
 BASE_MESSAGE_SCHEMA = vol.Schema(
     {
         vol.Required("id"): vol.Coerce(int),
@@ -41,13 +57,139 @@ WEB_AUDIO_CLIENTS = set()
 ACTIVE_AUDIO_STREAM = None
 
 
+class WebsocketEventHub:
+    """
+    Shares event subscriptions between websocket connections. Identical
+    subscriptions register a single event listener, and each event is
+    serialized once and the result fanned out to every subscribed client.
+    """
+
+    def __init__(self, ledfx):
+        self._ledfx = ledfx
+        # {key: (remove_listener, {(connection, subscription_id): streams})}
+        # where streams is the set of streams the subscriber has been sent
+        # the static description of
+        self._subscriptions = {}
+
+    def subscribe(
+        self,
+        connection,
+        subscription_id,
+        event_type,
+        event_filter,
+        compression=None,
+        fps=None,
+    ):
+        """
+        Subscribes a connection to an event. Events are sent as JSON, or
+        as binary if a compression is given, at most fps times a second
+        per stream if fps is given. Returns a function that removes the
+        subscription.
+        """
+        key = (
+            event_type,
+            json.dumps(event_filter, sort_keys=True),
+            compression,
+            fps,
+        )
+        if key not in self._subscriptions:
+            subscribers = {}
+            if compression is None:
+                callback = self._make_json_broadcast(subscribers)
+            else:
+                callback = self._make_binary_broadcast(
+                    subscribers, compression
+                )
+            if fps:
+                callback = self._throttle(callback, fps)
+            remove_listener = self._ledfx.events.add_listener(
+                callback, event_type, event_filter
+            )
+            self._subscriptions[key] = (remove_listener, subscribers)
+
+        subscribers = self._subscriptions[key][1]
+        subscribers[(connection, subscription_id)] = set()
+
+        def unsubscribe():
+            subscribers.pop((connection, subscription_id), None)
+            if not subscribers and key in self._subscriptions:
+                self._subscriptions.pop(key)[0]()
+
+        return unsubscribe
+
+    @staticmethod
+    def _throttle(callback, fps):
+        min_interval = 1 / fps
+        last_sent = {}
+
+        def throttled(event):
+            key = event.coalesce_key()
+            time_now = time.time()
+            if time_now - last_sent.get(key, 0) < min_interval:
+                return
+            last_sent[key] = time_now
+            callback(event)
+
+        return throttled
+
+    @staticmethod
+    def _make_json_broadcast(subscribers):
+        def broadcast(event):
+            try:
+                body = dumps(event.to_dict())
+            except TypeError as err:
+                _LOGGER.error(
+                    "Unable to serialize %s to JSON: %s", event.event_type, err
+                )
+                return
+            # Splice each subscription id into the shared serialized body
+            body = body[1:]
+            for connection, subscription_id in list(subscribers):
+                connection.send(
+                    f'{{"id": {subscription_id}, "type": "event", {body}'
+                )
+
+        return broadcast
+
+    @staticmethod
+    def _make_binary_broadcast(subscribers, compression):
+        def broadcast(event):
+            message = event.to_binary(compression)
+            stream = event.coalesce_key()
+            for (connection, subscription_id), streams in list(
+                subscribers.items()
+            ):
+                # Static data such as graph frequencies is sent once per
+                # subscription, ahead of its first binary frame
+                if stream not in streams:
+                    streams.add(stream)
+                    description = event.describe()
+                    if description is not None:
+                        connection.send(
+                            {
+                                "id": subscription_id,
+                                "type": "describe",
+                                **description,
+                            }
+                        )
+                connection.send(message)
+
+        return broadcast
+
+
 class WebsocketEndpoint(RestEndpoint):
 
     ENDPOINT_PATH = "/api/websocket"
 
+    def __init__(self, ledfx):
+        super().__init__(ledfx)
+        self._hub = WebsocketEventHub(ledfx)
+
     async def get(self, request) -> web.Response:
         try:
-            return await WebsocketConnection(self._ledfx).handle(request)
+            return await WebsocketConnection(self._ledfx, self._hub).handle(
+                request
+            )
         except ConnectionResetError:
             _LOGGER.debug(
                 "Connection Reset Error on Websocket Connection - retrying."
@@ -55,13 +197,15 @@ class WebsocketEndpoint(RestEndpoint):
 
 
 class WebsocketConnection:
-    def __init__(self, ledfx):
+    def __init__(self, ledfx, hub):
         self._ledfx = ledfx
+        self._hub = hub
         self._socket = None
         self._listeners = {}
         self._receiver_task = None
         self._sender_task = None
         self._sender_queue = asyncio.Queue(maxsize=MAX_PENDING_MESSAGES)
+        self._dropped_messages = 0
 
     def close(self):
         """Closes the websocket connection"""
@@ -77,19 +221,18 @@ class WebsocketConnection:
     def send(self, message):
         """Sends a message to the websocket connection"""
 
-        # If the queue is full, dump it and start again
-        if self._sender_queue.qsize() == MAX_PENDING_MESSAGES:
-            empty_queue(self._sender_queue)
-
-        try:
-            self._sender_queue.put_nowait(message)
-        except asyncio.QueueFull:
-            _LOGGER.error(
-                "Client sender queue size exceeded {}".format(
-                    MAX_PENDING_MESSAGES
+        # If the client can't keep up, drop the oldest pending message
+        if self._sender_queue.full():
+            self._sender_queue.get_nowait()
+            self._dropped_messages += 1
+            if self._dropped_messages % MAX_PENDING_MESSAGES == 1:
+                _LOGGER.warning(
+                    "Websocket client is falling behind, {} messages dropped".format(
+                        self._dropped_messages
+                    )
                 )
-            )
-            self.close()
+
+        self._sender_queue.put_nowait(message)
 
     def send_error(self, id, message):
         """Sends an error string to the websocket connection"""
@@ -118,7 +261,12 @@ class WebsocketConnection:
 
             try:
                 # _LOGGER.debug("Sending websocket message")
-                await self._socket.send_json(message, dumps=json.dumps)
+                if isinstance(message, bytes):
+                    await self._socket.send_bytes(message)
+                elif isinstance(message, str):
+                    await self._socket.send_str(message)
+                else:
+                    await self._socket.send_json(message, dumps=dumps)
             except TypeError as err:
                 _LOGGER.error(
                     "Unable to serialize to JSON: %s\n%s",
@@ -126,7 +274,12 @@ class WebsocketConnection:
                     message,
                 )
 
-        _LOGGER.info("Stopping sender")
+        if self._dropped_messages:
+            _LOGGER.info(
+                f"Stopping sender, {self._dropped_messages} messages dropped"
+            )
+        else:
+            _LOGGER.info("Stopping sender")
 
     async def handle(self, request):
         """Handle the websocket connection"""
@@ -229,18 +382,43 @@ class WebsocketConnection:
 
     @websocket_handler("subscribe_event")
     def subscribe_event_handler(self, message):
-        def notify_websocket(event):
-            self.send_event(message["id"], event)
+        compression = None
+        fps = message.get("fps")
+        if fps is not None and (not isinstance(fps, (int, float)) or fps <= 0):
+            self.send_error(message["id"], "fps must be a positive number.")
+            return
+        if message.get("format", "json") == "binary":
+            compressions = BINARY_EVENT_COMPRESSIONS.get(
+                message.get("event_type")
+            )
+            if compressions is None:
+                self.send_error(
+                    message["id"],
+                    "Binary format is not supported for this event type.",
+                )
+                return
+            compression = message.get("compression", compressions[0])
+            if compression not in compressions:
+                self.send_error(
+                    message["id"],
+                    f"Unknown compression '{compression}'.",
+                )
+                return
 
         _LOGGER.debug(
             "Websocket subscribing to event {} with filter {}".format(
                 message.get("event_type"), message.get("event_filter")
             )
         )
-        self._listeners[message["id"]] = self._ledfx.events.add_listener(
-            notify_websocket,
+        if message["id"] in self._listeners:
+            self._listeners.pop(message["id"])()
+        self._listeners[message["id"]] = self._hub.subscribe(
+            self,
+            message["id"],
             message.get("event_type"),
             message.get("event_filter", {}),
+            compression,
+            fps,
         )
 
     @websocket_handler("unsubscribe_event")
@@ -252,6 +430,24 @@ class WebsocketConnection:
         if subscription_id in self._listeners:
             self._listeners.pop(subscription_id)()
 
+    @websocket_handler("set_parameters")
+    def set_parameters_handler(self, message):
+        virtual = self._ledfx.virtuals.get(message.get("virtual_id"))
+        if virtual is None:
+            self.send_error(
+                message["id"],
+                f"Virtual with ID {message.get('virtual_id')} not found",
+            )
+            return
+        parameters = message.get("parameters")
+        if not isinstance(parameters, dict):
+            self.send_error(message["id"], "parameters must be an object.")
+            return
+        try:
+            virtual.set_effect_parameters(parameters)
+        except ValueError as msg:
+            self.send_error(message["id"], str(msg))
+
     @websocket_handler("audio_stream_start")
     def audio_stream_start_handler(self, message):
         client = message.get("client")
@@ -1,22 +1,34 @@
+import asyncio
+import concurrent.futures
 import datetime
 import json
 import logging
 import os
 import shutil
+import sqlite3
 import sys
+import threading
 
 import voluptuous as vol
 from pkg_resources import parse_version
 
+from ledfx.config_store import ConfigStore
 from ledfx.consts import CONFIGURATION_VERSION
 
 CONFIG_DIRECTORY = ".ledfx"
 CONFIG_FILE_NAME = "config.json"
+CONFIG_STORE_FILE_NAME = "config.db"
 PRESETS_FILE_NAME = "presets.json"
+DISCOVERY_CACHE_FILE_NAME = "wled_devices.json"
 
 PRIVATE_KEY_FILE = "privkey.pem"
 CHAIN_KEY_FILE = "fullchain.pem"
 
+# Saves requested within this many seconds are written out together
+CONFIG_SAVE_DEBOUNCE = 0.5
+# Seconds the writer waits for the event loop to snapshot the config
+CONFIG_SNAPSHOT_TIMEOUT = 5
+
 _default_wled_settings = {
     "wled_preferred_mode": "UDP",
     "realtime_gamma_enabled": False,
@@ -73,7 +85,6 @@ CORE_CONFIG_SCHEMA = vol.Schema(
         vol.Optional("virtuals", default=[]): list,
         vol.Optional("audio", default={}): dict,
         vol.Optional("melbanks", default={}): dict,
-        vol.Optional("ledfx_presets", default={}): dict,
         vol.Optional("user_presets", default={}): dict,
         vol.Optional("scenes", default={}): dict,
         vol.Optional("integrations", default=[]): list,
@@ -91,6 +102,16 @@ CORE_CONFIG_SCHEMA = vol.Schema(
         vol.Optional("user_colors", default={}): dict,
         vol.Optional("user_gradients", default={}): dict,
         vol.Optional("scan_on_startup", default=False): bool,
+        vol.Optional(
+            "render_workers",
+            description="Maximum number of effect render worker processes, 0 for one less than the CPU count",
+            default=0,
+        ): vol.All(int, vol.Range(0, 64)),
+        vol.Optional(
+            "scene_prewarm",
+            description="Build the effects of scenes ahead of their activation",
+            default=False,
+        ): bool,
         vol.Optional("wled_preferences", default={}): dict,
         vol.Optional(
             "configuration_version", default=CONFIGURATION_VERSION
@@ -123,6 +144,15 @@ def get_config_file(config_dir: str) -> str:
     return json_path  # Return the JSON file if we find one.
 
 
+def get_config_store_file(config_dir: str) -> str:
+    """Finds the config store in the provided directory, if it has one"""
+
+    store_path = os.path.join(config_dir, CONFIG_STORE_FILE_NAME)
+    if os.path.isfile(store_path) is False:
+        return None
+    return store_path
+
+
 def get_preset_file(config_dir: str) -> str:
     """Finds a supported preset file in the provided directory"""
 
@@ -132,6 +162,12 @@ def get_preset_file(config_dir: str) -> str:
     return json_path  # Return the JSON file if we find one.
 
 
+def get_discovery_cache_file(config_dir: str) -> str:
+    """Returns the path of the WLED discovery cache, which may not exist"""
+
+    return os.path.join(config_dir, DISCOVERY_CACHE_FILE_NAME)
+
+
 def get_profile_dump_location(config_dir) -> str:
     date_time = datetime.datetime.now().strftime("%d-%m-%y_%H-%M-%S")
     return os.path.join(config_dir, f"LedFx_{date_time}.profile")
@@ -220,6 +256,10 @@ def ensure_config_directory(config_dir: str) -> None:
 def load_config(config_dir: str) -> dict:
     """Validates and loads the configuration file in the provided directory"""
 
+    store_file = get_config_store_file(config_dir)
+    if store_file is not None:
+        return load_config_store(config_dir, store_file)
+
     config_file = ensure_config_file(config_dir)
     print(
         f"Loading configuration file: {os.path.join(os.path.abspath(config_dir), CONFIG_FILE_NAME)}"
@@ -228,30 +268,11 @@ def load_config(config_dir: str) -> dict:
 
         with open(config_file, encoding="utf-8") as file:
             config_json = json.load(file)
-            try:
-                # If there's no config version in the config, it's pre-1.0.0 and won't work
-                # Probably scope to iterate through it and create a virtual for every device, but that's beyond me
-                _LOGGER.info(
-                    f"LedFx Configuration Version: {config_json['configuration_version']}"
-                )
-                assert parse_version(
-                    config_json["configuration_version"]
-                ) == parse_version(CONFIGURATION_VERSION)
-                return CORE_CONFIG_SCHEMA(config_json)
-            except (KeyError, AssertionError):
-                create_backup(config_dir, config_file, "VERSION")
-                _LOGGER.warning(
-                    f"LedFx config version: {CONFIGURATION_VERSION}, your config version: {config_json.get('configuration_version', 'UNDEFINED (old!)')}"
-                )
-                try:
-                    config = migrate_config(config_json)
-                    save_config(config, config_dir)
-                except Exception as e:
-                    _LOGGER.exception(
-                        f"Failed to migrate your config to the new standard :( Your old config is backed up safely. Please let a developer know what happened: {e}"
-                    )
-                    config = {}
-                return CORE_CONFIG_SCHEMA(config)
+        return validate_config_version(
+            config_json,
+            config_dir,
+            lambda: create_backup(config_dir, config_file, "VERSION"),
+        )
     except json.JSONDecodeError:
         create_backup(config_dir, config_file, "DECODE")
         return CORE_CONFIG_SCHEMA({})
@@ -260,6 +281,85 @@ def load_config(config_dir: str) -> dict:
         return CORE_CONFIG_SCHEMA({})
 
 
+def load_config_store(config_dir: str, store_file: str) -> dict:
+    """Validates and loads the configuration from the config store"""
+
+    print(f"Loading configuration store: {os.path.abspath(store_file)}")
+    try:
+        config_json = ConfigStore.get(store_file).load()
+    except sqlite3.DatabaseError:
+        # Falls back to a config file from here on
+        create_backup(config_dir, store_file, "DECODE")
+        ConfigStore.discard(store_file)
+        return CORE_CONFIG_SCHEMA({})
+
+    def backup():
+        # Copy rather than move, the store is migrated in place
+        date = datetime.datetime.now().strftime("%d-%m-%y_%H-%M-%S")
+        backup_location = os.path.join(config_dir, f"config_backup_{date}.db")
+        shutil.copy2(store_file, backup_location)
+        _LOGGER.warning(
+            f"Incompatible Configuration Detected. Backup Located at: {backup_location}"
+        )
+
+    return validate_config_version(config_json, config_dir, backup)
+
+
+def validate_config_version(config_json, config_dir, backup) -> dict:
+    """
+    Validates a loaded config, migrating it if it is from an older
+    configuration version. backup is called before migrating.
+    """
+    try:
+        # If there's no config version in the config, it's pre-1.0.0 and won't work
+        # Probably scope to iterate through it and create a virtual for every device, but that's beyond me
+        _LOGGER.info(
+            f"LedFx Configuration Version: {config_json['configuration_version']}"
+        )
+        assert parse_version(
+            config_json["configuration_version"]
+        ) == parse_version(CONFIGURATION_VERSION)
+        return CORE_CONFIG_SCHEMA(config_json)
+    except (KeyError, AssertionError):
+        backup()
+        _LOGGER.warning(
+            f"LedFx config version: {CONFIGURATION_VERSION}, your config version: {config_json.get('configuration_version', 'UNDEFINED (old!)')}"
+        )
+        try:
+            config = migrate_config(config_json)
+            save_config(config, config_dir, immediate=True)
+        except Exception as e:
+            _LOGGER.exception(
+                f"Failed to migrate your config to the new standard :( Your old config is backed up safely. Please let a developer know what happened: {e}"
+            )
+            config = {}
+        return CORE_CONFIG_SCHEMA(config)
+
+
+def set_config_storage(config_dir: str, storage: str) -> None:
+    """
+    Moves the configuration between the config file ("json") and the
+    config store ("sqlite"). The one moved from is kept as a backup.
+    """
+    store_file = os.path.join(config_dir, CONFIG_STORE_FILE_NAME)
+    config_file = os.path.join(config_dir, CONFIG_FILE_NAME)
+    if storage == "sqlite" and get_config_store_file(config_dir) is None:
+        config = load_config(config_dir)
+        ConfigStore.get(store_file).save(config)
+        if os.path.isfile(config_file):
+            os.replace(config_file, f"{config_file}.bak")
+        _LOGGER.info(f"Moved configuration to {store_file}")
+    elif storage == "json" and get_config_store_file(config_dir) is not None:
+        config = load_config(config_dir)
+        atomic_write(
+            config_file,
+            json.dumps(config, ensure_ascii=False, sort_keys=True, indent=4),
+        )
+        os.replace(store_file, f"{store_file}.bak")
+        ConfigStore.discard(store_file)
+        _LOGGER.info(f"Moved configuration to {config_file}")
+
+
 def migrate_config(old_config):
     """
     attempts to update an old config to a working state
@@ -525,21 +625,139 @@ def create_backup(config_dir, config_file, errortype):
     _LOGGER.warning(f"Backup Located at: {backup_location}")
 
 
-def save_config(config: dict, config_dir: str) -> None:
-    """Saves the configuration to the provided directory"""
+def atomic_write(path: str, data: str) -> None:
+    """
+    Replaces the file at path with data, so that readers and crashes see
+    either the old or the new file but never a partial one
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
 
-    config_file = ensure_config_file(config_dir)
-    _LOGGER.info(("Saving configuration file to {}").format(config_dir))
-    config["configuration_version"] = CONFIGURATION_VERSION
-    config_view = dict(config)
-    unneeded_keys = ["ledfx_presets"]
-    for key in [key for key in config_view if key in unneeded_keys]:
-        del config_view[key]
 
-    with open(config_file, "w", encoding="utf-8") as file:
-        json.dump(
-            config_view, file, ensure_ascii=False, sort_keys=True, indent=4
-        )
+class ConfigWriter:
+    """
+    Persists the config of one config directory. The first save request
+    arms a timer, and when it fires the config is serialized once on the
+    thread that owns it, the event loop, and written on the timer thread.
+    Every request in between is coalesced into that one write, and costs
+    the requesting thread nothing but marking the config dirty.
+    """
+
+    _writers = {}
+    _writers_lock = threading.Lock()
+
+    def __init__(self, config_dir: str):
+        self._config_dir = config_dir
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._config = None
+        self._loop = None
+        self._timer = None
+
+    @classmethod
+    def get(cls, config_dir: str) -> "ConfigWriter":
+        with cls._writers_lock:
+            if config_dir not in cls._writers:
+                cls._writers[config_dir] = cls(config_dir)
+            return cls._writers[config_dir]
+
+    def request(self, config: dict) -> None:
+        """Schedules a save of config within the debounce window"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with self._lock:
+            self._config = config
+            if loop is not None:
+                self._loop = loop
+            if self._timer is None:
+                self._timer = threading.Timer(CONFIG_SAVE_DEBOUNCE, self.flush)
+                self._timer.name = "LedFx config writer"
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Writes a pending save now"""
+        with self._lock:
+            config, self._config = self._config, None
+            timer, self._timer = self._timer, None
+            loop = self._loop
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        if config is None:
+            return
+
+        try:
+            data = self._snapshot(config, loop)
+        except concurrent.futures.TimeoutError:
+            _LOGGER.warning("Event loop busy, retrying configuration save.")
+            self.request(config)
+            return
+        except (TypeError, ValueError) as e:
+            _LOGGER.error(f"Unable to serialize configuration: {e}")
+            return
+
+        with self._write_lock:
+            self._write(data)
+
+    @staticmethod
+    def _snapshot(config: dict, loop) -> str:
+        """Serializes config on the loop, unless that is this thread"""
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if loop is None or on_loop or not loop.is_running():
+            return json.dumps(config, ensure_ascii=False)
+
+        snapshot = concurrent.futures.Future()
+
+        def take_snapshot():
+            try:
+                snapshot.set_result(json.dumps(config, ensure_ascii=False))
+            except Exception as e:
+                snapshot.set_exception(e)
+
+        loop.call_soon_threadsafe(take_snapshot)
+        return snapshot.result(timeout=CONFIG_SNAPSHOT_TIMEOUT)
+
+    def _write(self, data: str) -> None:
+        store_file = get_config_store_file(self._config_dir)
+        config = json.loads(data)
+        if store_file is not None:
+            try:
+                # Only the changed records are written
+                ConfigStore.get(store_file).save(config)
+            except sqlite3.Error as e:
+                _LOGGER.error(f"Unable to save configuration store: {e}")
+            return
+
+        data = json.dumps(config, ensure_ascii=False, sort_keys=True, indent=4)
+
+        config_file = ensure_config_file(self._config_dir)
+        _LOGGER.info(f"Saving configuration file to {self._config_dir}")
+        try:
+            atomic_write(config_file, data)
+        except OSError as e:
+            _LOGGER.error(f"Unable to save configuration file: {e}")
+
+
+def save_config(config: dict, config_dir: str, immediate=False) -> None:
+    """
+    Saves the configuration to the provided directory. Unless immediate,
+    the save happens in the background and is coalesced with any other
+    saves requested shortly after.
+    """
+
+    config["configuration_version"] = CONFIGURATION_VERSION
+    writer = ConfigWriter.get(config_dir)
+    writer.request(config)
+    if immediate:
+        writer.flush()
 
 
 def save_presets(config: dict, config_dir: str) -> None:
@@ -552,7 +770,7 @@ def save_presets(config: dict, config_dir: str) -> None:
     for key in [key for key in config_view if key != "user_presets"]:
         del config_view[key]
 
-    with open(presets_file, "w", encoding="utf-8") as file:
-        json.dump(
-            config_view, file, ensure_ascii=False, sort_keys=True, indent=4
-        )
+    atomic_write(
+        presets_file,
+        json.dumps(config_view, ensure_ascii=False, sort_keys=True, indent=4),
+    )
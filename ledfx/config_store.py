@@ -0,0 +1,186 @@
+import json
+import logging
+import sqlite3
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS sections (
+        section TEXT PRIMARY KEY,
+        kind TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS records (
+        section TEXT NOT NULL,
+        key TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        value TEXT NOT NULL,
+        PRIMARY KEY (section, key)
+    )
+    """,
+)
+
+# How a config section is split into records:
+# "value" is a single record, "dict" is a record per item, and "list" is a
+# record per entity of a list of entities with unique ids, in list order.
+KIND_VALUE = "value"
+KIND_DICT = "dict"
+KIND_LIST = "list"
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def _section_records(value):
+    """Returns the kind of a config section and its {key: (position, json)}"""
+    if isinstance(value, dict):
+        return KIND_DICT, {
+            str(key): (position, _dumps(item))
+            for position, (key, item) in enumerate(value.items())
+        }
+
+    if isinstance(value, list) and value:
+        ids = [
+            item.get("id") if isinstance(item, dict) else None
+            for item in value
+        ]
+        if all(isinstance(id, str) for id in ids) and len(set(ids)) == len(
+            ids
+        ):
+            return KIND_LIST, {
+                id: (position, _dumps(item))
+                for position, (id, item) in enumerate(zip(ids, value))
+            }
+
+    return KIND_VALUE, {"": (0, _dumps(value))}
+
+
+class ConfigStore:
+    """
+    Stores the config in SQLite with a record per config section, or per
+    entity for sections such as devices, virtuals, scenes and presets. It
+    remembers what it last wrote, so a save only writes the records that
+    changed.
+    """
+
+    _stores = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self._path = path
+        self._kinds = {}
+        self._records = {}
+
+    @classmethod
+    def get(cls, path: str) -> "ConfigStore":
+        with cls._stores_lock:
+            if path not in cls._stores:
+                cls._stores[path] = cls(path)
+            return cls._stores[path]
+
+    @classmethod
+    def discard(cls, path: str) -> None:
+        """Forgets the store at path, for when its file is moved away"""
+        with cls._stores_lock:
+            cls._stores.pop(path, None)
+
+    def _connect(self):
+        connection = sqlite3.connect(self._path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    def load(self) -> dict:
+        """Rebuilds the config dict from the stored records"""
+        connection = self._connect()
+        try:
+            kinds = dict(
+                connection.execute("SELECT section, kind FROM sections")
+            )
+            rows = connection.execute(
+                "SELECT section, key, position, value FROM records "
+                "ORDER BY section, position"
+            ).fetchall()
+        finally:
+            connection.close()
+
+        config = {
+            section: {} if kind == KIND_DICT else []
+            for section, kind in kinds.items()
+            if kind != KIND_VALUE
+        }
+        records = {}
+        for section, key, position, value in rows:
+            records[section, key] = (position, value)
+            kind = kinds.get(section)
+            if kind == KIND_DICT:
+                config[section][key] = json.loads(value)
+            elif kind == KIND_LIST:
+                config[section].append(json.loads(value))
+            elif kind == KIND_VALUE:
+                config[section] = json.loads(value)
+
+        self._kinds = kinds
+        self._records = records
+        return config
+
+    def save(self, config: dict) -> None:
+        """Writes the records of config that differ from the last save"""
+        # Serialize everything before touching the database, so a config
+        # that fails to serialize writes nothing
+        kinds = {}
+        records = {}
+        for section, value in config.items():
+            kinds[section], section_records = _section_records(value)
+            for key, record in section_records.items():
+                records[section, key] = record
+
+        changed_kinds = [
+            (section, kind)
+            for section, kind in kinds.items()
+            if self._kinds.get(section) != kind
+        ]
+        removed_kinds = [
+            (section,) for section in self._kinds.keys() - kinds.keys()
+        ]
+        changed = [
+            (section, key, position, value)
+            for (section, key), (position, value) in records.items()
+            if self._records.get((section, key)) != (position, value)
+        ]
+        removed = list(self._records.keys() - records.keys())
+        if not (changed_kinds or removed_kinds or changed or removed):
+            return
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO sections VALUES (?, ?)",
+                    changed_kinds,
+                )
+                connection.executemany(
+                    "DELETE FROM sections WHERE section = ?", removed_kinds
+                )
+                connection.executemany(
+                    "DELETE FROM records WHERE section = ? AND key = ?",
+                    removed,
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                    changed,
+                )
+        finally:
+            connection.close()
+
+        _LOGGER.debug(
+            f"Saved {len(changed)} and removed {len(removed)} config records."
+        )
+        self._kinds = kinds
+        self._records = records
@@ -6,6 +6,7 @@ import warnings
 import webbrowser
 from concurrent.futures import ThreadPoolExecutor
 
+from ledfx import startup_profile
 from ledfx.color import (
     LEDFX_COLORS,
     LEDFX_GRADIENTS,
@@ -17,6 +18,7 @@ from ledfx.color import (
 from ledfx.config import get_ssl_certs, load_config, save_config
 from ledfx.devices import Devices
 from ledfx.effects import Effects
+from ledfx.effects.audio import get_audio_source
 from ledfx.effects.math import interpolate_pixels
 from ledfx.events import (
     Event,
@@ -26,7 +28,7 @@ from ledfx.events import (
 )
 from ledfx.http_manager import HttpServer
 from ledfx.integrations import Integrations
-from ledfx.presets import ledfx_presets
+from ledfx.render_pool import RenderPool
 from ledfx.scenes import Scenes
 from ledfx.utils import (
     RollingQueueHandler,
@@ -52,8 +54,8 @@ class LedFxCore:
     ):
         self.icon = icon
         self.config_dir = config_dir
-        self.config = load_config(config_dir)
-        self.config["ledfx_presets"] = ledfx_presets
+        with startup_profile.stage("Load config"):
+            self.config = load_config(config_dir)
         self.host = host if host else self.config["host"]
         self.port = port if port else self.config["port"]
         self.port_s = port_s if port_s else self.config["port_s"]
@@ -82,9 +84,10 @@ class LedFxCore:
         self.setup_logqueue()
         self.events = Events(self)
         self.setup_visualisation_events()
-        self.http = HttpServer(
-            ledfx=self, host=self.host, port=self.port, port_s=self.port_s
-        )
+        with startup_profile.stage("Create HTTP server"):
+            self.http = HttpServer(
+                ledfx=self, host=self.host, port=self.port, port_s=self.port_s
+            )
         self.exit_code = None
 
     def dev_enabled(self):
@@ -130,29 +133,35 @@ class LedFxCore:
     def setup_visualisation_events(self):
         """
         creates event listeners to fire visualisation events at
-        a given rate
+        a given rate, only while something is subscribed to them
         """
         min_time_since = 1 / self.config["visualisation_fps"]
         time_since_last = {}
         max_len = self.config["visualisation_maxlen"]
+        remove_listeners = []
 
         def handle_visualisation_update(event):
             is_device = event.event_type == Event.DEVICE_UPDATE
-            time_now = time.time()
 
             if is_device:
                 vis_id = getattr(event, "device_id")
             else:
                 vis_id = getattr(event, "virtual_id")
 
+            if not self.events.has_listeners(
+                Event.VISUALISATION_UPDATE, is_device=is_device, vis_id=vis_id
+            ):
+                return
+
+            time_now = time.time()
             try:
-                time_since = time_now - time_since_last[vis_id]
+                time_since = time_now - time_since_last[(is_device, vis_id)]
                 if time_since < min_time_since:
                     return
             except KeyError:
                 pass
 
-            time_since_last[vis_id] = time_now
+            time_since_last[(is_device, vis_id)] = time_now
 
             pixels = event.pixels
 
@@ -163,14 +172,30 @@ class LedFxCore:
                 VisualisationUpdateEvent(is_device, vis_id, pixels)
             )
 
-        self.events.add_listener(
-            handle_visualisation_update,
-            Event.VIRTUAL_UPDATE,
-        )
-
-        self.events.add_listener(
-            handle_visualisation_update,
-            Event.DEVICE_UPDATE,
+        def update_visualisation_demand():
+            # Only listen to pixel updates while visualisations are wanted,
+            # so that virtuals and devices skip building update events
+            wanted = self.events.has_listeners(Event.VISUALISATION_UPDATE)
+            if wanted and not remove_listeners:
+                remove_listeners.append(
+                    self.events.add_listener(
+                        handle_visualisation_update,
+                        Event.VIRTUAL_UPDATE,
+                    )
+                )
+                remove_listeners.append(
+                    self.events.add_listener(
+                        handle_visualisation_update,
+                        Event.DEVICE_UPDATE,
+                    )
+                )
+            elif not wanted and remove_listeners:
+                while remove_listeners:
+                    remove_listeners.pop()()
+                time_since_last.clear()
+
+        self.events.add_listeners_changed_hook(
+            update_visualisation_demand, Event.VISUALISATION_UPDATE
         )
 
     def setup_logqueue(self):
@@ -220,7 +245,8 @@ class LedFxCore:
 
     async def async_start(self, open_ui=False):
         _LOGGER.info("Starting LedFx")
-        await self.http.start(get_ssl_certs(config_dir=self.config_dir))
+        with startup_profile.stage("Start HTTP server"):
+            await self.http.start(get_ssl_certs(config_dir=self.config_dir))
         if (
             self.icon is not None
             and self.icon.notify is not None
@@ -229,11 +255,20 @@ class LedFxCore:
             self.icon.notify(
                 "Started in background.\nUse the tray icon to open.", "LedFx"
             )
-        self.devices = Devices(self)
-        self.effects = Effects(self)
+        with startup_profile.stage("Load device registry"):
+            self.devices = Devices(self)
+        with startup_profile.stage("Load effect registry"):
+            self.effects = Effects(self)
+        self.render_pool = RenderPool(self)
+        if self.config["audio"].get("broadcast"):
+            # Publish audio frames from startup for processes following them
+            with startup_profile.stage("Start audio broadcast"):
+                get_audio_source(self)
         self.virtuals = Virtuals(self)
-        self.integrations = Integrations(self)
-        self.scenes = Scenes(self)
+        with startup_profile.stage("Load integration registry"):
+            self.integrations = Integrations(self)
+        with startup_profile.stage("Create scenes"):
+            self.scenes = Scenes(self)
         self.colors = UserDefaultCollection(
             self,
             "Colors",
@@ -252,8 +287,10 @@ class LedFxCore:
         )
 
         # TODO: Deferr
-        self.devices.create_from_config(self.config["devices"])
-        await self.devices.async_initialize_devices()
+        with startup_profile.stage("Create devices"):
+            self.devices.create_from_config(self.config["devices"])
+        with startup_profile.stage("Initialize devices"):
+            await self.devices.async_initialize_devices()
 
         # sync_mode = WLED_CONFIG_SCHEMA(self.config["wled_preferences"])[
         #     "wled_preferred_mode"
@@ -261,8 +298,10 @@ class LedFxCore:
         # if sync_mode:
         #     await self.devices.set_wleds_sync_mode(sync_mode)
 
-        self.virtuals.create_from_config(self.config["virtuals"])
-        self.integrations.create_from_config(self.config["integrations"])
+        with startup_profile.stage("Create virtuals"):
+            self.virtuals.create_from_config(self.config["virtuals"])
+        with startup_profile.stage("Create integrations"):
+            self.integrations.create_from_config(self.config["integrations"])
 
         if self.config["scan_on_startup"]:
             async_fire_and_forget(self.devices.find_wled_devices(), self.loop)
@@ -274,6 +313,9 @@ class LedFxCore:
         if open_ui:
             self.open_ui()
 
+        if startup_profile.active():
+            print(startup_profile.report())
+
         await self.flush_loop()
 
     def stop(self, exit_code):
@@ -316,7 +358,9 @@ class LedFxCore:
         list(map(lambda task: task.cancel(), tasks))
 
         # Save the configuration before shutting down
-        save_config(config=self.config, config_dir=self.config_dir)
+        save_config(
+            config=self.config, config_dir=self.config_dir, immediate=True
+        )
 
         _LOGGER.info("Flushing loop...")
         await self.flush_loop()
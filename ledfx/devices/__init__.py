@@ -10,7 +10,8 @@ import serial.tools.list_ports
 import voluptuous as vol
 import zeroconf
 
-from ledfx.config import save_config
+from ledfx.config import get_discovery_cache_file, save_config
+from ledfx.discovery import WLEDDiscovery
 from ledfx.events import DeviceUpdateEvent, Event
 from ledfx.utils import (
     AVAILABLE_FPS,
@@ -18,12 +19,21 @@ from ledfx.utils import (
     BaseRegistry,
     RegistryLoader,
     async_fire_and_forget,
+    dns_cache,
     generate_id,
     resolve_destination,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Devices brought online at the same time
+DEVICE_INIT_CONCURRENCY = 16
+# Seconds a device gets to come online before it is retried in the background
+DEVICE_INIT_TIMEOUT = 5
+# Seconds between background retries of offline devices, doubling up to max
+DEVICE_INIT_RETRY_INTERVAL = 5
+DEVICE_INIT_RETRY_MAX_INTERVAL = 300
+
 
 def fps_validator(value):
     if not isinstance(value, int):
@@ -143,7 +153,12 @@ class Device(BaseRegistry):
             self.flush(frame)
             # _LOGGER.debug(f"Device {self.id} flushed by Virtual {virtual_id}")
 
-            self._ledfx.events.fire_event(DeviceUpdateEvent(self.id, frame))
+            if self._ledfx.events.has_listeners(
+                Event.DEVICE_UPDATE, device_id=self.id
+            ):
+                self._ledfx.events.fire_event(
+                    DeviceUpdateEvent(self.id, frame)
+                )
 
     def assemble_frame(self):
         """
@@ -459,11 +474,18 @@ class Devices(RegistryLoader):
         super().__init__(ledfx, Device, self.PACKAGE_NAME)
 
         def on_shutdown(e):
+            for task in self._retry_tasks:
+                task.cancel()
             self._zeroconf.close()
             self.deactivate_devices()
+            async_fire_and_forget(WLED.close_session(), self._ledfx.loop)
 
         self._ledfx.events.add_listener(on_shutdown, Event.LEDFX_SHUTDOWN)
         self._zeroconf = zeroconf.Zeroconf()
+        self._retry_tasks = set()
+        self.discovery = WLEDDiscovery(
+            ledfx, get_discovery_cache_file(ledfx.config_dir)
+        )
 
     def create_from_config(self, config):
         for device in config:
@@ -489,17 +511,70 @@ class Devices(RegistryLoader):
         return None
 
     async def async_initialize_devices(self):
-        tasks = [
-            device.async_initialize()
+        """
+        Brings the devices online concurrently. Devices that fail or take
+        longer than DEVICE_INIT_TIMEOUT are retried in the background, so
+        offline devices don't hold up startup.
+        """
+        semaphore = asyncio.Semaphore(DEVICE_INIT_CONCURRENCY)
+
+        async def initialize(device):
+            async with semaphore:
+                return await self._async_initialize_device(device)
+
+        devices = [
+            device
             for device in self.values()
             if hasattr(device, "async_initialize")
         ]
+        results = await asyncio.gather(
+            *(initialize(device) for device in devices)
+        )
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for device, online in zip(devices, results):
+            if not online:
+                task = asyncio.create_task(self._async_retry_device(device))
+                self._retry_tasks.add(task)
+                task.add_done_callback(self._retry_tasks.discard)
 
-        for result in results:
-            if type(result) is ValueError:
-                _LOGGER.warning(result)
+    async def _async_initialize_device(self, device):
+        """Returns whether the device came online"""
+        try:
+            await asyncio.wait_for(
+                device.async_initialize(), DEVICE_INIT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                f"Device {device.name}: Timed out coming online, is it online?"
+            )
+            return False
+        except ValueError as msg:
+            _LOGGER.warning(msg)
+            return False
+        except Exception:
+            # Such as a host answering with something other than WLED's
+            # json, which shouldn't stop the other devices coming online
+            _LOGGER.exception(f"Device {device.name}: Failed to come online")
+            return False
+        # Networked devices log and carry on when they can't be resolved
+        return getattr(device, "_destination", True) is not None
+
+    async def _async_retry_device(self, device):
+        interval = DEVICE_INIT_RETRY_INTERVAL
+        while True:
+            await asyncio.sleep(interval)
+            if self.get(device.id) is not device:
+                return
+            was_active = device.is_active()
+            if await self._async_initialize_device(device):
+                break
+            interval = min(interval * 2, DEVICE_INIT_RETRY_MAX_INTERVAL)
+
+        _LOGGER.info(f"Device {device.name}: Came online")
+        if was_active:
+            # Restart with the config the device reported
+            device.deactivate()
+            device.activate()
 
     async def add_new_device(self, device_type, device_config):
         """
@@ -546,12 +621,12 @@ class Devices(RegistryLoader):
                         _LOGGER.info(msg)
                         raise ValueError(msg)
 
-        # If WLED device, get all the necessary config from the device itself
+        # If WLED device, get all the necessary config from the device itself, or
+        # the discovery cache if it is a known controller
         if device_type == "wled":
             wled = WLED(resolved_dest)
-            wled_config = await wled.get_config()
+            wled_config = await self.discovery.get_controller(resolved_dest)
 
-            led_info = wled_config["leds"]
             # If we've found the device via WLED scan, it won't have a custom name from the frontend
             # However if it's "WLED" (i.e, Default) then we will name the device exactly how WLED does, by using the second half of it's MAC address
             # This allows us to respect the users choice of names if adding a WLED device via frontend
@@ -564,8 +639,8 @@ class Devices(RegistryLoader):
             else:
                 wled_name = wled_config['name']
             # fmt: on
-            wled_count = led_info["count"]
-            wled_rgbmode = led_info["rgbw"]
+            wled_count = wled_config["led_count"]
+            wled_rgbmode = wled_config["rgbw"]
 
             wled_config = {
                 "name": wled_name,
@@ -696,26 +771,49 @@ class Devices(RegistryLoader):
 class WLEDListener(zeroconf.ServiceBrowser):
     def __init__(self, _ledfx):
         self._ledfx = _ledfx
+        # Service name: hostname, for the services found by this listener
+        self._hostnames = {}
+
+    def _cache_address(self, info):
+        """Caches the announced address of a service"""
+        hostname = str(info.server).rstrip(".")
+        self._hostnames[info.name] = hostname
+        addresses = info.parsed_addresses(zeroconf.IPVersion.V4Only)
+        address = addresses[0] if addresses else None
+        if address is not None:
+            dns_cache.update(hostname, address)
+        return hostname, address
 
     def remove_service(self, zeroconf_obj, type, name):
         _LOGGER.info(f"Service {name} removed")
+        hostname = self._hostnames.pop(name, None)
+        if hostname is not None:
+            dns_cache.invalidate(hostname)
+
+    def update_service(self, zeroconf_obj, type, name):
+        info = zeroconf_obj.get_service_info(type, name)
+
+        if info:
+            self._cache_address(info)
 
     def add_service(self, zeroconf_obj, type, name):
         info = zeroconf_obj.get_service_info(type, name)
 
         if info:
-            hostname = str(info.server).rstrip(".")
+            hostname, address = self._cache_address(info)
             _LOGGER.info(f"Found device: {hostname}")
 
-            device_type = "wled"
-            device_config = {"ip_address": hostname}
+            # WLED announces its MAC, which tells if it is a known controller
+            mac = info.properties.get(b"mac")
+            if mac is not None:
+                mac = mac.decode(errors="replace")
 
             def handle_exception(future):
                 # Ignore exceptions, these will be raised when a device is found that already exists
                 exc = future.exception()
 
             async_fire_and_forget(
-                self._ledfx.devices.add_new_device(device_type, device_config),
+                self._ledfx.devices.discovery.discover(hostname, address, mac),
                 loop=self._ledfx.loop,
                 exc_handler=handle_exception,
             )
@@ -113,18 +113,16 @@ class WLEDDevice(NetworkedDevice):
         #     self.setup_subdevice()
         #     return
         self.wled = WLED(self._destination)
-        wled_config = await self.wled.get_config()
-
-        led_info = wled_config["leds"]
-        wled_name = wled_config["name"]
-        wled_count = led_info["count"]
-        wled_rgbmode = led_info["rgbw"]
-        wled_version = wled_config["ver"]
+        # A controller that was just discovered or added is not queried again
+        controller = await self._ledfx.devices.discovery.get_controller(
+            self._destination
+        )
+        wled_version = controller["version"]
 
         wled_config = {
-            "name": wled_name,
-            "pixel_count": wled_count,
-            "rgbw_led": wled_rgbmode,
+            "name": controller["name"],
+            "pixel_count": controller["led_count"],
+            "rgbw_led": controller["rgbw"],
         }
 
         self._config.update(wled_config)
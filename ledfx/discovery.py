@@ -0,0 +1,139 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+
+from ledfx.config import atomic_write
+from ledfx.utils import WLED
+
+_LOGGER = logging.getLogger(__name__)
+
+# WLED devices queried at the same time during discovery
+DISCOVERY_CONCURRENCY = 8
+# Seconds a cached controller is trusted for after it was announced or
+# queried, which covers adding and initializing a discovered device
+DISCOVERY_FRESH_TIME = 60
+
+
+def normalize_mac(mac: str) -> str:
+    return mac.lower().replace(":", "")
+
+
+class WLEDDiscovery:
+    """
+    Registry of the WLED controllers LedFx has seen, by MAC address, kept in
+    a cache file. A controller that has just announced the MAC and address
+    it is cached with, or has just been queried, is served from the cache
+    rather than queried again. Queries are shared by concurrent discoveries
+    of the same address, and limited to DISCOVERY_CONCURRENCY at a time.
+    """
+
+    def __init__(self, ledfx, path: str):
+        self._ledfx = ledfx
+        self._path = path
+        self._controllers = self._load()
+        # address: (MAC, time) it was last announced with or queried at
+        self._seen = {}
+        # address: future of the query in progress
+        self._queries = {}
+        # hostnames being discovered
+        self._discovering = set()
+        self._semaphore = None
+        # The latest cache contents waiting to be written
+        self._pending_write = None
+        self._write_lock = threading.Lock()
+
+    def _load(self) -> dict:
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            _LOGGER.warning(f"Ignoring WLED discovery cache: {e}")
+            return {}
+
+    def _write(self) -> None:
+        # Whichever write runs first writes the latest contents, and the
+        # writes queued behind it find nothing left to do
+        with self._write_lock:
+            data, self._pending_write = self._pending_write, None
+            if data is None:
+                return
+            try:
+                atomic_write(self._path, data)
+            except OSError as e:
+                _LOGGER.warning(f"Failed to save WLED discovery cache: {e}")
+
+    def _save(self) -> None:
+        data = json.dumps(self._controllers, indent=4, sort_keys=True)
+        with self._write_lock:
+            self._pending_write = data
+        self._ledfx.loop.run_in_executor(
+            self._ledfx.thread_executor, self._write
+        )
+
+    def _see(self, address: str, mac: str) -> None:
+        self._seen[address] = (mac, time.monotonic())
+
+    def _remember(self, address: str, info: dict) -> dict:
+        """Records the json/info of the WLED controller at address"""
+        controller = {
+            "mac": normalize_mac(info["mac"]),
+            "ip_address": address,
+            "name": info["name"],
+            "led_count": info["leds"]["count"],
+            "rgbw": info["leds"]["rgbw"],
+            "version": info["ver"],
+        }
+        if self._controllers.get(controller["mac"]) != controller:
+            self._controllers[controller["mac"]] = controller
+            self._save()
+        return controller
+
+    async def get_controller(self, address: str) -> dict:
+        """
+        Returns the cached record of the controller at address if it was
+        just announced with the MAC and address it is cached with, or just
+        queried, and queries it otherwise
+        """
+        mac, seen = self._seen.get(address, (None, 0))
+        controller = self._controllers.get(mac)
+        if (
+            controller is not None
+            and controller["ip_address"] == address
+            and time.monotonic() - seen < DISCOVERY_FRESH_TIME
+        ):
+            _LOGGER.debug(f"WLED {address}: Using cached config")
+            return controller
+
+        query = self._queries.get(address)
+        if query is None:
+            query = asyncio.ensure_future(self._query(address))
+            self._queries[address] = query
+            query.add_done_callback(lambda _: self._queries.pop(address))
+        return await asyncio.shield(query)
+
+    async def _query(self, address: str) -> dict:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+        async with self._semaphore:
+            info = await WLED(address).get_config()
+        controller = self._remember(address, info)
+        self._see(address, controller["mac"])
+        return controller
+
+    async def discover(self, hostname: str, address: str, mac: str = None):
+        """Adds the WLED controller announced at hostname as a device"""
+        if mac is not None and address is not None:
+            self._see(address, normalize_mac(mac))
+        if hostname in self._discovering:
+            return
+        self._discovering.add(hostname)
+        try:
+            await self._ledfx.devices.add_new_device(
+                "wled", {"ip_address": hostname}
+            )
+        finally:
+            self._discovering.discard(hostname)
@@ -55,6 +55,23 @@ def mix_colors(color_1, color_2, ratio):
         )
 
 
+def mix_colors_array(colors_1, colors_2, ratio, out=None):
+    """
+    Array form of mix_colors. Blends an (n, 3) array of colors towards
+    colors_2, either a single color or an (n, 3) array, by ratio, either a
+    scalar or an array of n per pixel ratios. out may be colors_1.
+    """
+    ratio = np.asarray(ratio, dtype=float)
+    if ratio.ndim == 1:
+        ratio = ratio[:, np.newaxis]
+    if out is None:
+        out = np.empty(np.shape(colors_1))
+
+    np.multiply(colors_1, 1 - ratio, out=out)
+    out += np.multiply(colors_2, ratio)
+    return out
+
+
 def fill_rainbow(pixels, initial_hue, delta_hue):
     hue = initial_hue
     sat = 0.95
@@ -200,6 +217,8 @@ class Effect(BaseRegistry):
     _config = None
     _active = False
     _virtual = None
+    # Live parameter ranges by effect class
+    _parameter_ranges = {}
 
     # Basic effect properties that can be applied to all effects
     CONFIG_SCHEMA = vol.Schema(
@@ -238,6 +257,8 @@ class Effect(BaseRegistry):
     def __init__(self, ledfx, config):
         self._ledfx = ledfx
         self._config = {}
+        self._pending_parameters = {}
+        self._parameters_lock = threading.Lock()
         self.update_config(config)
         self.lock = threading.Lock()
 
@@ -270,7 +291,7 @@ class Effect(BaseRegistry):
     def update_config(self, config):
         # TODO: Sync locks to ensure everything is thread safe
 
-        validated_config = type(self).schema()(config)
+        validated_config = type(self).validate_config(config)
         prior_config = self._config
 
         if self._config != {}:
@@ -278,6 +299,13 @@ class Effect(BaseRegistry):
             self._config = {**prior_config, **config}
         else:
             self._config = validated_config
+        self._config_changed()
+
+        _LOGGER.debug(
+            f"Effect {self.NAME} config updated to {validated_config}."
+        )
+
+    def _config_changed(self):
         self.configured_blur = self._config["blur"]
 
         self._bg_color = (
@@ -298,12 +326,80 @@ class Effect(BaseRegistry):
             if base.config_updated != super(base, base).config_updated:
                 base.config_updated(self, self._config)
 
-        _LOGGER.debug(
-            f"Effect {self.NAME} config updated to {validated_config}."
-        )
-
         self.configured_blur = self._config["blur"]
 
+    @classmethod
+    def parameter_ranges(cls):
+        """
+        Returns the live parameters of the effect: the numeric config keys
+        with a range, as {key: (type, range validator)}
+        """
+        if cls not in Effect._parameter_ranges:
+            ranges = {}
+            for key, validator in cls.schema().schema.items():
+                if not isinstance(validator, vol.All):
+                    continue
+                coerce = next(
+                    (
+                        v.type
+                        for v in validator.validators
+                        if isinstance(v, vol.Coerce) and v.type in (int, float)
+                    ),
+                    None,
+                )
+                valid_range = next(
+                    (
+                        v
+                        for v in validator.validators
+                        if isinstance(v, vol.Range)
+                    ),
+                    None,
+                )
+                if coerce is not None and valid_range is not None:
+                    ranges[str(key)] = (coerce, valid_range)
+            Effect._parameter_ranges[cls] = ranges
+        return Effect._parameter_ranges[cls]
+
+    def check_parameters(self, parameters):
+        """
+        Range checks live parameters, raising ValueError for any that are
+        unknown or out of range. Returns the coerced parameters.
+        """
+        ranges = type(self).parameter_ranges()
+        checked = {}
+        for key, value in parameters.items():
+            if key not in ranges:
+                raise ValueError(
+                    f"{key} is not a live parameter of {self.NAME}"
+                )
+            coerce, valid_range = ranges[key]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{key} must be a number")
+            try:
+                checked[key] = valid_range(coerce(value))
+            except vol.Invalid as e:
+                raise ValueError(f"{key}: {e}")
+        return checked
+
+    def set_parameters(self, parameters):
+        """
+        Sets live parameters without revalidating the whole config. They
+        are applied together at the start of the next frame, so a burst of
+        updates between two frames only reconfigures the effect once.
+        Returns the coerced parameters.
+        """
+        checked = self.check_parameters(parameters)
+        with self._parameters_lock:
+            self._pending_parameters.update(checked)
+        return checked
+
+    def _apply_parameters(self):
+        with self._parameters_lock:
+            parameters = self._pending_parameters
+            self._pending_parameters = {}
+        self._config = {**self._config, **parameters}
+        self._config_changed()
+
     def config_updated(self, config):
         """
         Optional event for when an effect's config is updated. This
@@ -315,6 +411,8 @@ class Effect(BaseRegistry):
 
     def _render(self):
         self.lock.acquire()
+        if self._pending_parameters:
+            self._apply_parameters()
         self.render()
         self.lock.release()
 
@@ -1,8 +1,12 @@
 import logging
+import os
 import queue
+import struct
+import threading
 import time
 from collections import deque
 from functools import cached_property, lru_cache
+from multiprocessing import resource_tracker, shared_memory
 
 import aubio
 import numpy as np
@@ -22,6 +26,28 @@ _LOGGER = logging.getLogger(__name__)
 MIN_MIDI = 21
 MAX_MIDI = 108
 
+# Shared-memory audio broadcast
+AUDIO_BROADCAST_NAME = "ledfx_audio"
+AUDIO_RING_SLOTS = 16
+AUDIO_RING_MAGIC = 0x4C454446
+AUDIO_RING_VERSION = 1
+# How often a reader checks the ring for new frames
+AUDIO_POLL_INTERVAL = 0.002
+# How long a shared source waits for frames before reattaching to the ring
+AUDIO_BROADCAST_TIMEOUT = 2.0
+# How many times a reader retries a torn read before skipping the frame
+SEQLOCK_RETRIES = 8
+AUDIO_FRAME_SCALARS = (
+    "volume",
+    "volume_raw",
+    "pitch",
+    "onset",
+    "bpm_beat_now",
+    "volume_beat_now",
+    "bar_oscillator",
+    "beat_counter",
+)
+
 
 class AudioInputSource:
 
@@ -107,6 +133,21 @@ class AudioInputSource:
                     default=0,
                     description="Add a delay to LedFx's output to sync with your audio. Useful for Bluetooth devices which typically have a short audio lag.",
                 ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+                vol.Optional(
+                    "broadcast",
+                    default=False,
+                    description="Publish the audio analysis to shared memory for other LedFx processes on this host",
+                ): bool,
+                vol.Optional(
+                    "shared_source",
+                    default=False,
+                    description="Use the audio analysis broadcast by another LedFx process instead of an audio device",
+                ): bool,
+                vol.Optional(
+                    "broadcast_name",
+                    default=AUDIO_BROADCAST_NAME,
+                    description="Name of the shared memory audio broadcast",
+                ): str,
             },
             extra=vol.ALLOW_EXTRA,
         )
@@ -455,6 +496,23 @@ class AudioAnalysisSource(AudioInputSource):
         self.subscribe(self.volume_beat_now)
         self.subscribe(self.freq_power)
 
+        self._broadcast = None
+        if self._config["broadcast"]:
+            self._broadcast = AudioFrameRing.create(
+                self.melbanks.mel_count,
+                self.melbanks.mel_len,
+                self._config["broadcast_name"],
+            )
+            self.subscribe(self.broadcast_frame)
+
+            def close_broadcast(e):
+                self._broadcast.close()
+                self._broadcast = None
+
+            self._ledfx.events.add_listener(
+                close_broadcast, Event.LEDFX_SHUTDOWN
+            )
+
     def initialise_analysis(self):
         # melbanks
         if not hasattr(self, "melbanks"):
@@ -719,6 +777,375 @@ class AudioAnalysisSource(AudioInputSource):
         """
         return self.bar_oscillator() % 1
 
+    def broadcast_frame(self):
+        """Publishes the analysis of this frame to the broadcast ring"""
+        # Read once, the broadcast may be closed from the loop meanwhile
+        broadcast = self._broadcast
+        if broadcast is None or broadcast.mel_count != self.melbanks.mel_count:
+            return
+        broadcast.publish(self)
+
+
+class AudioFrameRing:
+    """
+    A ring of audio analysis frames in shared memory. Every slot has its
+    own sequence counter, which the single writer makes odd while it fills
+    the slot, so readers can detect torn or overwritten frames without
+    taking any locks. The writer's publish and close do share a lock, so
+    the ring can be closed while another thread is publishing to it.
+    """
+
+    # magic, version, slot count, melbank count, melbank length, head
+    HEADER = struct.Struct("<6q")
+    HEADER_WORDS = 6
+    HEAD = 5
+
+    def __init__(self, shm, owner):
+        magic, version, slots, mel_count, mel_len, _ = self.HEADER.unpack_from(
+            shm.buf
+        )
+        if magic != AUDIO_RING_MAGIC or version != AUDIO_RING_VERSION:
+            raise ValueError(f"{shm.name} is not a LedFx audio broadcast")
+
+        self._shm = shm
+        self._owner = owner
+        self.slots = slots
+        self.mel_count = mel_count
+        self.mel_len = mel_len
+        self.frame_size = self.frame_size_for(mel_count, mel_len)
+        self._slot_size = 2 + self.frame_size
+        words = self.HEADER_WORDS + slots * self._slot_size
+        self._words = np.ndarray((words,), dtype=np.int64, buffer=shm.buf)
+        self._floats = np.ndarray((words,), dtype=np.float64, buffer=shm.buf)
+        self._staging = np.zeros(self.frame_size)
+        self._staging_fields = self.unpack(self._staging)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def frame_size_for(mel_count, mel_len):
+        return (
+            len(AUDIO_FRAME_SCALARS)
+            + 2 * len(AudioAnalysisSource.freq_max_mels)
+            + 2 * mel_count * mel_len
+        )
+
+    @classmethod
+    def create(cls, mel_count, mel_len, name=None, slots=AUDIO_RING_SLOTS):
+        """Creates a ring, named if other processes need to find it"""
+        size = 8 * (
+            cls.HEADER_WORDS
+            + slots * (2 + cls.frame_size_for(mel_count, mel_len))
+        )
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            _LOGGER.warning(
+                f"Replacing existing audio broadcast {name}, it may belong to a process that did not shut down cleanly."
+            )
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        cls.HEADER.pack_into(
+            shm.buf,
+            0,
+            AUDIO_RING_MAGIC,
+            AUDIO_RING_VERSION,
+            slots,
+            mel_count,
+            mel_len,
+            0,
+        )
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name, track=True):
+        """
+        Attaches to an existing ring. Unrelated processes should not track
+        it, or their resource tracker unlinks the ring when they exit.
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        if not track and os.name == "posix":
+            resource_tracker.unregister(shm._name, "shared_memory")
+        try:
+            return cls(shm, owner=False)
+        except ValueError:
+            shm.close()
+            raise
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def head(self):
+        """Index of the latest published frame"""
+        return int(self._words[self.HEAD])
+
+    def unpack(self, data):
+        """
+        Splits a flat frame into views of (scalars, raw freq powers,
+        filtered freq powers, melbanks, filtered melbanks)
+        """
+        scalars = len(AUDIO_FRAME_SCALARS)
+        powers = len(AudioAnalysisSource.freq_max_mels)
+        melbanks = scalars + 2 * powers
+        mel_size = self.mel_count * self.mel_len
+        mel_shape = (self.mel_count, self.mel_len)
+        return (
+            data[:scalars],
+            data[scalars : scalars + powers],
+            data[scalars + powers : melbanks],
+            data[melbanks : melbanks + mel_size].reshape(mel_shape),
+            data[melbanks + mel_size :].reshape(mel_shape),
+        )
+
+    def _slot(self, index):
+        return self.HEADER_WORDS + (index % self.slots) * self._slot_size
+
+    def publish(self, audio):
+        """Writes the current analysis of an AudioAnalysisSource to the ring"""
+        with self._lock:
+            # Closed meanwhile
+            if self._words is None:
+                return
+            self._publish(audio)
+
+    def _publish(self, audio):
+        (
+            scalars,
+            freq_power_raw,
+            freq_power_filtered,
+            melbanks,
+            melbanks_filtered,
+        ) = self._staging_fields
+        scalars[:] = (
+            audio.volume(filtered=True),
+            audio.volume(filtered=False),
+            audio.pitch(),
+            audio.onset(),
+            audio.bpm_beat_now(),
+            audio.volume_beat_now(),
+            audio.bar_oscillator(),
+            audio.beat_counter,
+        )
+        freq_power_raw[:] = audio.freq_power_raw
+        freq_power_filtered[:] = audio.freq_power_filter.value
+        melbanks[:] = audio.melbanks.melbanks
+        melbanks_filtered[:] = audio.melbanks.melbanks_filtered
+
+        index = self.head + 1
+        offset = self._slot(index)
+        self._words[offset] += 1
+        self._words[offset + 1] = index
+        self._floats[offset + 2 : offset + 2 + self.frame_size] = self._staging
+        self._words[offset] += 1
+        self._words[self.HEAD] = index
+
+    def read(self, index, out):
+        """Copies frame index into out, False if it is gone or kept tearing"""
+        offset = self._slot(index)
+        for _ in range(SEQLOCK_RETRIES):
+            sequence = self._words[offset]
+            if sequence & 1:
+                continue
+            if self._words[offset + 1] != index:
+                return False
+            np.copyto(
+                out, self._floats[offset + 2 : offset + 2 + self.frame_size]
+            )
+            if self._words[offset] == sequence:
+                return True
+        return False
+
+    def frames_since(self, index, out):
+        """
+        Copies each frame published after index into out in turn and
+        yields its index. Readers that fell behind skip the frames that
+        have since been overwritten.
+        """
+        head = self.head
+        # The slot after head may already be mid-write, so keep clear of it
+        for i in range(max(index + 1, head - self.slots + 2), head + 1):
+            if self.read(i, out):
+                yield i
+
+    def close(self):
+        with self._lock:
+            if self._words is None:
+                return
+            # The views have to go before the mapping can be closed
+            self._words = None
+            self._floats = None
+            self._staging_fields = None
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+
+
+class SharedAudioSource(AudioAnalysisSource):
+    """
+    Follows the analysis broadcast by another LedFx process on this host
+    instead of opening an audio device, so the FFT and melbank work only
+    happens once. Both processes need the same melbank configuration.
+    """
+
+    SHARED_CONFIG_SCHEMA = vol.Schema(
+        {
+            vol.Optional("sample_rate", default=60): int,
+            vol.Optional("fft_size", default=FFT_SIZE): int,
+            vol.Optional("broadcast_name", default=AUDIO_BROADCAST_NAME): str,
+        },
+        extra=vol.ALLOW_EXTRA,
+    )
+
+    def __init__(self, ledfx, config):
+        self._callbacks = []
+        self._ring = None
+        self._thread = None
+        self._stopped = threading.Event()
+        AudioInputSource.__init__(self, ledfx, config)
+
+    def update_config(self, config):
+        if self._is_activated:
+            self.deactivate()
+        self._config = self.CONFIG_SCHEMA(self.SHARED_CONFIG_SCHEMA(config))
+        self.initialise_analysis()
+        self._shared_scalars = dict.fromkeys(AUDIO_FRAME_SCALARS, 0.0)
+        if len(self._callbacks) != 0:
+            self.activate()
+
+    def activate(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._follow_broadcast,
+            name="LedFx shared audio",
+            daemon=True,
+        )
+        self._is_activated = True
+        self._thread.start()
+
+    def deactivate(self):
+        self._stopped.set()
+        if (
+            self._thread is not None
+            and self._thread is not threading.current_thread()
+        ):
+            self._thread.join()
+        self._thread = None
+        self._is_activated = False
+        _LOGGER.info("Shared audio source closed.")
+
+    def _attach_ring(self):
+        name = self._config["broadcast_name"]
+        ring = AudioFrameRing.attach(name, track=False)
+        if (ring.mel_count, ring.mel_len) != (
+            self.melbanks.mel_count,
+            self.melbanks.mel_len,
+        ):
+            ring.close()
+            raise ValueError(
+                f"Audio broadcast {name} uses a different melbank configuration"
+            )
+        self._ring = ring
+        self._frame_data = np.zeros(ring.frame_size)
+        self._frame_fields = ring.unpack(self._frame_data)
+        _LOGGER.info(f"Following audio broadcast {name}.")
+
+    def _close_ring(self):
+        if self._ring is not None:
+            self._frame_fields = None
+            self._ring.close()
+            self._ring = None
+
+    def _follow_broadcast(self):
+        frame_index = 0
+        last_frame = time.time()
+        waiting = False
+        try:
+            while not self._stopped.is_set():
+                if self._ring is None:
+                    try:
+                        self._attach_ring()
+                    except (FileNotFoundError, ValueError) as e:
+                        if not waiting:
+                            _LOGGER.warning(
+                                f"Waiting for audio broadcast {self._config['broadcast_name']}: {e}"
+                            )
+                            waiting = True
+                        self._stopped.wait(AUDIO_BROADCAST_TIMEOUT)
+                        continue
+                    waiting = False
+                    frame_index = self._ring.head
+                    last_frame = time.time()
+
+                for frame_index in self._ring.frames_since(
+                    frame_index, self._frame_data
+                ):
+                    self._load_frame()
+                    self._invoke_callbacks()
+                    last_frame = time.time()
+
+                if time.time() - last_frame > AUDIO_BROADCAST_TIMEOUT:
+                    # The publisher may have restarted with a new ring
+                    self._close_ring()
+                    continue
+
+                self._stopped.wait(AUDIO_POLL_INTERVAL)
+        finally:
+            self._close_ring()
+
+    def _load_frame(self):
+        (
+            scalars,
+            freq_power_raw,
+            freq_power_filtered,
+            melbanks,
+            melbanks_filtered,
+        ) = self._frame_fields
+        self._shared_scalars = dict(zip(AUDIO_FRAME_SCALARS, scalars.tolist()))
+        self.beat_counter = int(self._shared_scalars["beat_counter"])
+        self.freq_power_raw[:] = freq_power_raw
+        self.freq_power_filter.value = freq_power_filtered.copy()
+        for i in range(self.melbanks.mel_count):
+            self.melbanks.melbanks[i][:] = melbanks[i]
+            self.melbanks.melbanks_filtered[i][:] = melbanks_filtered[i]
+            if self._ledfx.dev_enabled():
+                self.melbanks.fire_graph_update(i)
+
+    def volume(self, filtered=True):
+        return self._shared_scalars["volume" if filtered else "volume_raw"]
+
+    def pitch(self):
+        return self._shared_scalars["pitch"]
+
+    def onset(self):
+        return bool(self._shared_scalars["onset"])
+
+    def bpm_beat_now(self):
+        return bool(self._shared_scalars["bpm_beat_now"])
+
+    def volume_beat_now(self):
+        return bool(self._shared_scalars["volume_beat_now"])
+
+    def bar_oscillator(self):
+        return self._shared_scalars["bar_oscillator"]
+
+
+def get_audio_source(ledfx):
+    """
+    Returns the audio analysis source, creating it if needed. With the
+    shared_source audio option it follows another process's broadcast.
+    """
+    config = ledfx.config.get("audio", {})
+    if config.get("shared_source"):
+        source_cls = SharedAudioSource
+    else:
+        source_cls = AudioAnalysisSource
+    if type(ledfx.audio) is not source_cls:
+        ledfx.audio = source_cls(ledfx, config)
+    return ledfx.audio
+
 
 @Effect.no_registration
 class AudioReactiveEffect(Effect):
@@ -732,15 +1159,8 @@ class AudioReactiveEffect(Effect):
         _LOGGER.info("Activating AudioReactiveEffect.")
         super().activate(channel)
 
-        if not self._ledfx.audio or id(AudioAnalysisSource) != id(
-            self._ledfx.audio.__class__
-        ):
-            self._ledfx.audio = AudioAnalysisSource(
-                self._ledfx, self._ledfx.config.get("audio", {})
-            )
-
-        self.audio = self._ledfx.audio
-        self._ledfx.audio.subscribe(self._audio_data_updated)
+        self.audio = get_audio_source(self._ledfx)
+        self.audio.subscribe(self._audio_data_updated)
 
     def deactivate(self):
         _LOGGER.info("Deactivating AudioReactiveEffect.")
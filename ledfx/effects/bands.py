@@ -3,6 +3,7 @@ import voluptuous as vol
 
 from ledfx.effects.audio import AudioReactiveEffect
 from ledfx.effects.gradient import GradientEffect
+from ledfx.effects.math import band_layout, banded_fill
 
 
 class BandsAudioEffect(AudioReactiveEffect, GradientEffect):
@@ -39,25 +40,13 @@ class BandsAudioEffect(AudioReactiveEffect, GradientEffect):
         self.r = self.melbank(filtered=True, size=self.pixel_count)
 
     def render(self):
-        out = np.tile(self.r, (3, 1)).T
-        np.clip(out, 0, 1, out=out)
-        out_split = np.array_split(out, self._config["band_count"], axis=0)
-        for i in range(self._config["band_count"]):
-            band_width = len(out_split[i])
-            color = self.get_gradient_color(i / self._config["band_count"])
-            vol = int(out_split[i].max() * band_width)  # length (vol) of band
-            out_split[i][:] = self.bkg_color
-            if vol:
-                out_split[i][:vol] = color
-            if self._config["align"] == "center":
-                out_split[i] = np.roll(
-                    out_split[i], (band_width - vol) // 2, axis=0
-                )
-            elif self._config["align"] == "invert":
-                out_split[i] = np.roll(out_split[i], -vol // 2, axis=0)
-            elif self._config["align"] == "right":
-                out_split[i] = np.flip(out_split[i], axis=0)
-            elif self._config["align"] == "left":
-                pass
-
-        self.pixels = np.vstack(out_split)
+        band_count = self._config["band_count"]
+        layout = band_layout(self.pixel_count, band_count)
+        levels = np.clip(np.maximum.reduceat(self.r, layout.starts), 0, 1)
+        lit = banded_fill(levels, layout, self._config["align"])
+        colors = self.get_gradient_colors(
+            np.arange(len(layout.widths)) / band_count
+        )
+        self.pixels = np.where(
+            lit[:, np.newaxis], colors[layout.band], self.bkg_color
+        )
@@ -3,6 +3,7 @@ import voluptuous as vol
 
 from ledfx.effects.audio import AudioReactiveEffect
 from ledfx.effects.gradient import GradientEffect
+from ledfx.effects.math import band_layout
 
 
 class BandsMatrixAudioEffect(AudioReactiveEffect, GradientEffect):
@@ -35,28 +36,69 @@ class BandsMatrixAudioEffect(AudioReactiveEffect, GradientEffect):
         # Create the filters used for the effect
         self.bkg_color = np.array((0, 0, 0), dtype=float)
         self.flip_gradient = config["flip_gradient"]
+        # Invalidate the band layout and gradient lookup table
+        self._gradient_curve = None
+        self._band_layout_key = None
+        self._band_curve = None
+
+    def _compile_bands(self):
+        """
+        Precomputes, for every output pixel, its band, its position up the
+        band and its gradient color. Odd bands run in reverse (serpentine),
+        which is folded into the tables through a permutation index.
+        """
+        pixel_count = self.pixel_count
+        layout = band_layout(pixel_count, self._config["band_count"])
+        band_widths = layout.widths
+        band_starts = layout.starts
+        band = layout.band
+        position = layout.position
+        point = position / band_widths[band]
+        if self.flip_gradient:
+            point = 1 - point
+        gradient_index = ((pixel_count - 1) * point).astype(int)
+
+        serpentine = np.arange(pixel_count)
+        odd = band % 2 != 0
+        serpentine[odd] = (
+            band_starts[band[odd]] + band_widths[band[odd]] - 1 - position[odd]
+        )
+
+        self._band_widths = band_widths
+        self._band_starts = band_starts
+        self._band = band[serpentine]
+        self._band_position = position[serpentine]
+        self._band_gradient_index = gradient_index[serpentine]
+        self._band_curve = None
+        self._band_layout_key = (
+            pixel_count,
+            self._config["band_count"],
+            self.flip_gradient,
+        )
 
     def audio_data_updated(self, data):
         # Grab the filtered melbank
         self.r = self.melbank(filtered=True, size=self.pixel_count)
 
     def render(self):
-        out = np.tile(self.r, (3, 1)).T
-        np.clip(out, 0, 1, out=out)
-        out_split = np.array_split(out, self._config["band_count"], axis=0)
-        for i in range(self._config["band_count"]):
-            band_width = len(out_split[i])
-            volume = int(out_split[i].max() * band_width)
-            out_split[i][volume:] = self.bkg_color
-            for p in range(volume):
-                gradient_value = (
-                    1 - p / band_width
-                    if self.flip_gradient
-                    else p / band_width
-                )
-                out_split[i][p] = self.get_gradient_color(gradient_value)
-
-            if i % 2 != 0:
-                out_split[i] = np.flip(out_split[i], axis=0)
-
-        self.pixels = np.vstack(out_split)
+        self._assert_gradient()
+        if self._band_layout_key != (
+            self.pixel_count,
+            self._config["band_count"],
+            self.flip_gradient,
+        ):
+            self._compile_bands()
+        if self._band_curve is not self._gradient_curve:
+            self._band_colors = self._gradient_curve[
+                :, self._band_gradient_index
+            ].T
+            self._band_curve = self._gradient_curve
+
+        r = np.clip(self.r, 0, 1)
+        volume = (
+            np.maximum.reduceat(r, self._band_starts) * self._band_widths
+        ).astype(int)
+        lit = self._band_position < volume[self._band]
+        self.pixels = np.where(
+            lit[:, np.newaxis], self._band_colors, self.bkg_color
+        )
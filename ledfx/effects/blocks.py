@@ -3,6 +3,7 @@ import voluptuous as vol
 
 from ledfx.effects.audio import AudioReactiveEffect
 from ledfx.effects.gradient import GradientEffect
+from ledfx.effects.math import band_layout
 
 
 class BlocksAudioEffect(AudioReactiveEffect, GradientEffect):
@@ -28,14 +29,12 @@ class BlocksAudioEffect(AudioReactiveEffect, GradientEffect):
         self.r = self.melbank(filtered=True, size=self.pixel_count)
 
     def render(self):
-        out = np.tile(self.r, (3, 1))
-        out_split = np.array_split(out, self._config["block_count"], axis=1)
-        for i in range(self._config["block_count"]):
-            color = self.get_gradient_color(i / self._config["block_count"])[
-                :, np.newaxis
-            ]
-            out_split[i] = np.multiply(
-                out_split[i], (out_split[i].max() * color)
-            )
-
-        self.pixels = np.hstack(out_split).T
+        block_count = self._config["block_count"]
+        layout = band_layout(self.pixel_count, block_count)
+        # Each block is colored by its gradient color times its peak
+        levels = np.maximum.reduceat(self.r, layout.starts)
+        colors = self.get_gradient_colors(
+            np.arange(len(layout.widths)) / block_count
+        )
+        colors *= levels[:, np.newaxis]
+        self.pixels = self.r[:, np.newaxis] * colors[layout.band]
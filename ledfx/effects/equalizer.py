@@ -3,6 +3,7 @@ import voluptuous as vol
 
 from ledfx.effects.audio import AudioReactiveEffect
 from ledfx.effects.gradient import GradientEffect
+from ledfx.effects.math import band_layout, banded_fill
 
 
 class EQAudioEffect(AudioReactiveEffect, GradientEffect):
@@ -39,23 +40,8 @@ class EQAudioEffect(AudioReactiveEffect, GradientEffect):
         np.clip(self.r, 0, 1, out=self.r)
 
     def render(self):
-        r_split = np.array_split(self.r, self._config["gradient_repeat"])
-        for i in range(self._config["gradient_repeat"]):
-            band_width = len(r_split[i])
-            # length (volume) of band
-            volume = int(r_split[i].mean() * band_width)
-            r_split[i][:] = 0
-            if volume:
-                r_split[i][:volume] = 1
-            if self._config["align"] == "center":
-                r_split[i] = np.roll(
-                    r_split[i], (band_width - volume) // 2, axis=0
-                )
-            elif self._config["align"] == "invert":
-                r_split[i] = np.roll(r_split[i], -volume // 2, axis=0)
-            elif self._config["align"] == "right":
-                r_split[i] = np.flip(r_split[i], axis=0)
-            elif self._config["align"] == "left":
-                pass
-
-        self.pixels = self.apply_gradient(np.hstack(r_split))
+        layout = band_layout(self.pixel_count, self._config["gradient_repeat"])
+        # Mean level of each segment
+        levels = np.add.reduceat(self.r, layout.starts) / layout.widths
+        lit = banded_fill(levels, layout, self._config["align"])
+        self.apply_gradient(lit, out=self.pixels)
@@ -71,31 +71,41 @@ class Fire(AudioReactiveEffect, HSVEffect):
 
         np.multiply(pixels, self.cooling, out=pixels)
 
-        for k in range(self.pixel_count - 1, 4, -1):
-            h1 = pixels[k - 1]
-            h2 = pixels[k - 2]
-            h3 = pixels[k - 3]
-            h4 = pixels[k - 4]
-            pixels[k] = (h1 + h2 + h3 * 2 + h4 * 3) / 7
-
-        for i in range(self.spark_count):
-
-            if self.sparks[i] <= 0:
-                self.sparks[i] = np.random.random(1)
-
-            self.sparks[i] += self.accel * delta
-            ox = self.sparkX[i]
-            self.sparkX[i] += self.sparks[i] * self.sparks[i] * delta
-
-            if self.sparkX[i] > self.pixel_count:
-                self.sparkX[i] = 0
-                self.sparks[i] = 0
-                continue
-
-            j = int(ox)
-            while j < self.sparkX[i]:
-                pixels[j] += np.clip(1 - self.sparks[i] * 0.4, 0, 1) * 0.5
-                j += 1
+        # Heat diffuses upwards: each pixel from the 6th becomes a causal
+        # FIR of the four below it. The right hand side is evaluated before
+        # assignment, so every tap reads the pre-diffusion heat.
+        if self.pixel_count > 5:
+            pixels[5:] = (
+                pixels[4:-1]
+                + pixels[3:-2]
+                + pixels[2:-3] * 2
+                + pixels[1:-4] * 3
+            ) / 7
+
+        # Relaunch spent sparks and move them all along
+        spent = self.sparks <= 0
+        self.sparks[spent] = np.random.random(np.count_nonzero(spent))
+        self.sparks += self.accel * delta
+        start = self.sparkX.astype(int)
+        self.sparkX += self.sparks * self.sparks * delta
+
+        finished = self.sparkX > self.pixel_count
+        self.sparkX[finished] = 0
+        self.sparks[finished] = 0
+        moving = ~finished
+
+        # Each moving spark leaves a trail of heat over the pixels it
+        # passed, [int(old x), new x)
+        start = start[moving]
+        lengths = np.maximum(
+            np.ceil(self.sparkX[moving]).astype(int) - start, 0
+        )
+        heat = np.clip(1 - self.sparks[moving] * 0.4, 0, 1) * 0.5
+        spark_index = np.repeat(np.arange(len(lengths)), lengths)
+        trail_offset = np.arange(len(spark_index)) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        np.add.at(pixels, start[spark_index] + trail_offset, heat[spark_index])
 
         np.power(pixels, 2, out=self.h)
         np.clip(self.h, 0, 1, out=self.h)
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 import numpy as np
 import voluptuous as vol
@@ -11,6 +12,69 @@ from ledfx.effects.temporal import TemporalEffect
 _LOGGER = logging.getLogger(__name__)
 
 
+def _ease(chunk_len, start_val, end_val, slope=1.5):
+    x = np.linspace(0, 1, chunk_len)
+    diff = end_val - start_val
+    pow_x = np.power(x, slope)
+    return diff * pow_x / (pow_x + np.power(1 - x, slope)) + start_val
+
+
+@lru_cache(maxsize=64)
+def gradient_curve(gradient, gradient_length):
+    """
+    Returns the (3, gradient_length) color curve of a gradient. Curves are
+    cached process wide and shared between effects, so they are read only.
+    """
+    _LOGGER.debug(f"Generating new gradient curve: {gradient}")
+
+    try:
+        gradient = parse_gradient(gradient)
+    except ValueError:
+        gradient = RGB(0, 0, 0)
+
+    if isinstance(gradient, RGB):
+        curve = np.tile(gradient, (gradient_length, 1)).astype(float).T
+        curve.flags.writeable = False
+        return curve
+
+    gradient_colors = gradient.colors
+
+    # fill in start and end colors if not explicitly given
+    if gradient_colors[0][1] != 0.0:
+        gradient_colors.insert(0, (gradient_colors[0][0], 0.0))
+
+    if gradient_colors[-1][1] != 1.0:
+        gradient_colors.insert(-1, (gradient_colors[-1][0], 1.0))
+
+    # split colors and splits into two separate groups
+    gradient_colors, gradient_splits = zip(*gradient_colors)
+
+    # turn splits into real indexes to split array
+    gradient_splits = [
+        int(gradient_length * position)
+        for position in gradient_splits
+        if 0 < position < 1
+    ]
+    # pair colors (1,2), (2,3), (3,4) for color transition of each segment
+    gradient_colors_paired = zip(gradient_colors, gradient_colors[1:])
+
+    # create gradient array and split it up into the segments
+    curve = np.zeros((gradient_length, 3)).astype(float)
+    gradient_segments = np.split(curve, gradient_splits, axis=0)
+
+    for (color_1, color_2), segment in zip(
+        gradient_colors_paired, gradient_segments
+    ):
+        segment_len = len(segment)
+        segment[:, 0] = _ease(segment_len, color_1[0], color_2[0])
+        segment[:, 1] = _ease(segment_len, color_1[1], color_2[1])
+        segment[:, 2] = _ease(segment_len, color_1[2], color_2[2])
+
+    curve = curve.T
+    curve.flags.writeable = False
+    return curve
+
+
 @Effect.no_registration
 class GradientEffect(Effect):
     """
@@ -36,6 +100,7 @@ class GradientEffect(Effect):
 
     _gradient_curve = None
     _gradient_roll_counter = 0
+    _gradient_roll = 0
 
     def _comb(self, N, k):
         N = int(N)
@@ -60,59 +125,11 @@ class GradientEffect(Effect):
         return self._comb(n, i) * (t ** (n - i)) * (1 - t) ** i
 
     def _ease(self, chunk_len, start_val, end_val, slope=1.5):
-        x = np.linspace(0, 1, chunk_len)
-        diff = end_val - start_val
-        pow_x = np.power(x, slope)
-        return diff * pow_x / (pow_x + np.power(1 - x, slope)) + start_val
+        return _ease(chunk_len, start_val, end_val, slope)
 
     def _generate_gradient_curve(self, gradient, gradient_length):
-        _LOGGER.debug(f"Generating new gradient curve: {gradient}")
-
-        try:
-            gradient = parse_gradient(gradient)
-        except ValueError:
-            gradient = RGB(0, 0, 0)
-
-        if isinstance(gradient, RGB):
-            self._gradient_curve = (
-                np.tile(gradient, (gradient_length, 1)).astype(float).T
-            )
-            return
-
-        gradient_colors = gradient.colors
-
-        # fill in start and end colors if not explicitly given
-        if gradient_colors[0][1] != 0.0:
-            gradient_colors.insert(0, (gradient_colors[0][0], 0.0))
-
-        if gradient_colors[-1][1] != 1.0:
-            gradient_colors.insert(-1, (gradient_colors[-1][0], 1.0))
-
-        # split colors and splits into two separate groups
-        gradient_colors, gradient_splits = zip(*gradient_colors)
-
-        # turn splits into real indexes to split array
-        gradient_splits = [
-            int(gradient_length * position)
-            for position in gradient_splits
-            if 0 < position < 1
-        ]
-        # pair colors (1,2), (2,3), (3,4) for color transition of each segment
-        gradient_colors_paired = zip(gradient_colors, gradient_colors[1:])
-
-        # create gradient array and split it up into the segments
-        gradient = np.zeros((gradient_length, 3)).astype(float)
-        gradient_segments = np.split(gradient, gradient_splits, axis=0)
-
-        for (color_1, color_2), segment in zip(
-            gradient_colors_paired, gradient_segments
-        ):
-            segment_len = len(segment)
-            segment[:, 0] = self._ease(segment_len, color_1[0], color_2[0])
-            segment[:, 1] = self._ease(segment_len, color_1[1], color_2[1])
-            segment[:, 2] = self._ease(segment_len, color_1[2], color_2[2])
-
-        self._gradient_curve = gradient.T
+        self._gradient_curve = gradient_curve(gradient, gradient_length)
+        self._gradient_roll = 0
 
     def _assert_gradient(self):
         if (
@@ -135,29 +152,56 @@ class GradientEffect(Effect):
             pixels_to_roll = np.floor(self._gradient_roll_counter)
             self._gradient_roll_counter -= pixels_to_roll
 
-            self._gradient_curve = np.roll(
-                self._gradient_curve,
-                int(pixels_to_roll),
-                axis=1,
-            )
+            # The shared curve is never copied, rolling just moves the
+            # offset it is read from
+            self._gradient_roll = (
+                self._gradient_roll + int(pixels_to_roll)
+            ) % self._gradient_curve.shape[1]
 
     def get_gradient_color(self, point):
         self._assert_gradient()
 
-        return self._gradient_curve[:, int((self.pixel_count - 1) * point)]
+        index = int((self.pixel_count - 1) * point) - self._gradient_roll
+        return self._gradient_curve[:, index % self.pixel_count]
+
+    def get_gradient_colors(self, points):
+        """get_gradient_color for an array of points, as (len(points), 3)"""
+        self._assert_gradient()
+
+        points = (self.pixel_count - 1) * np.asarray(points)
+        index = points.astype(int) - self._gradient_roll
+        return self._gradient_curve[:, index % self.pixel_count].T
 
     def config_updated(self, config):
         """Invalidate the gradient"""
         self._gradient_curve = None
 
-    def apply_gradient(self, y):
+    def apply_gradient(self, y, out=None):
+        """
+        Colors y, a scalar or an array of pixel_count values, with the
+        gradient. Writes into out, a (pixel_count, 3) array, if given.
+        """
         self._assert_gradient()
 
-        output = self._gradient_curve * y
+        curve = self._gradient_curve
+        if out is None:
+            out = np.empty((curve.shape[1], 3))
+
+        # Multiply through the rolled gradient as two slices
+        roll = self._gradient_roll
+        split = curve.shape[1] - roll
+        y = np.asarray(y)
+        if y.ndim == 0:
+            y_head = y_tail = y
+        else:
+            y_head, y_tail = y[:roll], y[roll:]
+        np.multiply(curve[:, split:], y_head, out=out.T[:, :roll])
+        np.multiply(curve[:, :split], y_tail, out=out.T[:, roll:])
+
         # Apply and roll the gradient if necessary
         self._roll_gradient()
 
-        return output.T
+        return out
 
 
 class TemporalGradientEffect(TemporalEffect, GradientEffect, ModulateEffect):
@@ -173,5 +217,5 @@ class TemporalGradientEffect(TemporalEffect, GradientEffect, ModulateEffect):
         # TODO: Could add some cool effects like twinkle or sin modulation
         # of the gradient.
         # kinda done
-        pixels = self.apply_gradient(1)
+        pixels = self.apply_gradient(1, out=self.pixels)
         self.pixels = self.modulate(pixels)
@@ -79,8 +79,16 @@ class HSVEffect(GradientEffect):
 
     def on_activate(self, pixel_count):
         self.hsv_array = np.zeros((pixel_count, 3))
+        self._allocate_scratch(pixel_count)
         # self.output = np.zeros((pixel_count, 3))
 
+    def _allocate_scratch(self, pixel_count):
+        """Preallocated buffers so that render doesn't allocate per frame"""
+        self._hue_scratch = np.zeros(pixel_count)
+        self._hue_index = np.zeros(pixel_count, dtype=int)
+        self._channel_max = np.zeros((pixel_count, 1))
+        self._saturation_scratch = np.zeros((pixel_count, 3))
+
     def config_updated(self, config):
         # forcibly invalidate the gradient
         self._gradient_curve = None
@@ -91,24 +99,33 @@ class HSVEffect(GradientEffect):
         self._assert_gradient()
         self.render_hsv()
 
-        hsv = np.copy(self.hsv_array)
-
-        h = hsv[:, 0]
-        s = hsv[:, 1].reshape(-1, 1)
-        v = hsv[:, 2].reshape(-1, 1)
         pixels = self.pixels
+        if len(self._hue_index) != len(pixels):
+            self._allocate_scratch(len(pixels))
+        h = self._hue_scratch
+        s = self._saturation_scratch
+        channel_max = self._channel_max
 
         # Convert hues to gradient indexes
-        h %= 1
-        h *= self.pixel_count - 1
-        h = h.astype(int)
+        np.mod(self.hsv_array[:, 0], 1, out=h)
+        np.multiply(h, self.pixel_count - 1, out=h)
+        np.copyto(self._hue_index, h, casting="unsafe")
         # Grab the colors from the gradient
-        self._assert_gradient()
-        pixels[:] = self._gradient_curve[:, h].T
+        np.take(
+            self._gradient_curve.T,
+            self._hue_index,
+            axis=0,
+            out=pixels,
+            mode="clip",
+        )
         # Apply saturation to colors
-        pixels += (np.max(pixels, axis=1).reshape(-1, 1) - pixels) * (1 - s)
+        np.max(pixels, axis=1, out=channel_max[:, 0])
+        np.subtract(channel_max, pixels, out=s)
+        np.subtract(1, self.hsv_array[:, 1], out=h)
+        np.multiply(s, h[:, np.newaxis], out=s)
+        pixels += s
         # Apply value (brightness) to colors
-        pixels *= v
+        np.multiply(pixels, self.hsv_array[:, 2, np.newaxis], out=pixels)
 
     def render_hsv(self):
         """
@@ -37,4 +37,4 @@ class MagnitudeAudioEffect(AudioReactiveEffect, GradientEffect):
         self.magnitude = getattr(data, self.power_func)()
 
     def render(self):
-        self.pixels = self.apply_gradient(self.magnitude)
+        self.apply_gradient(self.magnitude, out=self.pixels)
@@ -1,3 +1,4 @@
+from collections import namedtuple
 from functools import lru_cache
 
 import numpy as np
@@ -8,22 +9,73 @@ def _normalized_linspace(size):
     return np.linspace(0, 1, size)
 
 
+@lru_cache(maxsize=64)
+def _interpolation_weights(old_length, new_length):
+    """
+    Source indices and blend weights to linearly resample old_length
+    pixels to new_length pixels
+    """
+    positions = np.linspace(0, old_length - 1, new_length)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, old_length - 1)
+    weights = (positions - lower)[:, np.newaxis]
+    return lower, upper, weights
+
+
 def interpolate_pixels(pixels, new_length):
     """Resizes a pixel array by linearly interpolating the values"""
     if len(pixels) == new_length:
         return pixels
 
-    x_old = _normalized_linspace(len(pixels))
-    x_new = _normalized_linspace(new_length)
-    new_pixels = np.zeros((len(x_new), pixels.shape[1]))
-
-    new_pixels[:, 0] = np.interp(x_new, x_old, pixels[:, 0])
-    new_pixels[:, 1] = np.interp(x_new, x_old, pixels[:, 1])
-    new_pixels[:, 2] = np.interp(x_new, x_old, pixels[:, 2])
+    lower, upper, weights = _interpolation_weights(len(pixels), new_length)
+    new_pixels = pixels[lower] * (1 - weights)
+    new_pixels += pixels[upper] * weights
 
     return new_pixels
 
 
+BandLayout = namedtuple("BandLayout", "widths,starts,band,position")
+
+
+@lru_cache(maxsize=64)
+def band_layout(pixel_count, band_count):
+    """
+    Splits pixel_count pixels into band_count contiguous bands the way
+    np.array_split does, leaving out empty bands. Gives the width and start
+    of each band, and for every pixel its band and its position in the band.
+    """
+    widths = np.full(band_count, pixel_count // band_count)
+    widths[: pixel_count % band_count] += 1
+    widths = widths[widths > 0]
+    starts = np.cumsum(widths) - widths
+    band = np.repeat(np.arange(len(widths)), widths)
+    position = np.arange(pixel_count) - starts[band]
+    for array in (widths, starts, band, position):
+        array.setflags(write=False)
+    return BandLayout(widths, starts, band, position)
+
+
+def banded_fill(levels, layout, align="left"):
+    """
+    Lights int(level * width) pixels of each band of a band_layout and
+    returns which pixels are lit. align places the lit run in its band:
+    "left", "right", "center", or "invert" to split it over both ends.
+    """
+    widths = layout.widths
+    volumes = (levels * widths).astype(int)
+    if align == "right":
+        starts = widths - volumes
+    elif align == "center":
+        starts = (widths - volumes) // 2
+    elif align == "invert":
+        starts = (-volumes // 2) % widths
+    else:
+        starts = np.zeros_like(volumes)
+
+    band = layout.band
+    return (layout.position - starts[band]) % widths[band] < volumes[band]
+
+
 class ExpFilter:
     """Simple exponential smoothing filter"""
 
@@ -0,0 +1,60 @@
+import numpy as np
+
+from ledfx.effects import Effect
+
+
+@Effect.no_registration
+class MatrixEffect(Effect):
+    """
+    Base for effects that draw natively in 2D. Child effects draw into
+    self.matrix, a (height, width, 3) array shaped like the virtual, which
+    is mapped onto the virtual's pixels with a single gather through the
+    virtual's precompiled layout index.
+    """
+
+    _matrix_index = None
+
+    def on_activate(self, pixel_count):
+        self._matrix_index = None
+        self._assert_matrix()
+
+    def _assert_matrix(self):
+        index = self._virtual.matrix_index
+        if index is self._matrix_index:
+            return
+        self._matrix_index = index
+        self.matrix = np.zeros((*self._virtual.matrix_shape, 3))
+        self.matrix_resized(*self._virtual.matrix_shape)
+
+    @property
+    def matrix_height(self):
+        return self.matrix.shape[0]
+
+    @property
+    def matrix_width(self):
+        return self.matrix.shape[1]
+
+    def matrix_resized(self, height, width):
+        """
+        Optional event for when the matrix is (re)allocated, eg. to size
+        buffers the effect draws with
+        """
+        pass
+
+    def render(self):
+        self._assert_matrix()
+        self.render_matrix()
+        np.take(
+            self.matrix.reshape(-1, 3),
+            self._matrix_index,
+            axis=0,
+            out=self.pixels,
+            mode="clip",
+        )
+
+    def render_matrix(self):
+        """
+        To be defined by child class
+        Draw the frame into self.matrix
+        """
+        pass
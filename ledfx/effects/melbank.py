@@ -1,6 +1,5 @@
 import logging
-
-# import time
+import time
 from collections import namedtuple
 from math import log
 
@@ -13,7 +12,7 @@ import voluptuous as vol
 import ledfx.effects.mel as mel
 from ledfx.effects import fast_blur_array
 from ledfx.effects.math import ExpFilter
-from ledfx.events import GraphUpdateEvent
+from ledfx.events import Event, GraphUpdateEvent
 
 # Since fft size and mic rate are tightly linked to melbank resolution,
 # they're defined here and imported into ledfx.audio
@@ -446,6 +445,7 @@ class Melbanks:
     def __init__(self, ledfx, audio, config):
         self._ledfx = ledfx
         self._audio = audio
+        self._graph_last_sent = {}
         self.update_config(config)
 
     def update_config(self, config):
@@ -500,10 +500,26 @@ class Melbanks:
                 self.melbanks_filtered[i][:] = 0
 
             if self._ledfx.dev_enabled():
-                self._ledfx.events.fire_event(
-                    GraphUpdateEvent(
-                        f"melbank_{i}",
-                        self.melbanks_filtered[i],
-                        self.melbank_processors[i].melbank_frequencies,
-                    )
-                )
+                self.fire_graph_update(i)
+
+    def fire_graph_update(self, i):
+        """Fires a melbank graph event if subscribed, at most at visualisation fps"""
+        graph_id = f"melbank_{i}"
+        if not self._ledfx.events.has_listeners(
+            Event.GRAPH_UPDATE, graph_id=graph_id
+        ):
+            return
+
+        time_now = time.time()
+        min_time_since = 1 / self._ledfx.config["visualisation_fps"]
+        if time_now - self._graph_last_sent.get(i, 0) < min_time_since:
+            return
+        self._graph_last_sent[i] = time_now
+
+        self._ledfx.events.fire_event(
+            GraphUpdateEvent(
+                graph_id,
+                self.melbanks_filtered[i],
+                self.melbank_processors[i].melbank_frequencies,
+            )
+        )
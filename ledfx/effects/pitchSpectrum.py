@@ -1,7 +1,7 @@
 import voluptuous as vol
 
 from ledfx.color import RGB
-from ledfx.effects import mix_colors
+from ledfx.effects import mix_colors_array
 from ledfx.effects.audio import MAX_MIDI, MIN_MIDI, AudioReactiveEffect
 from ledfx.effects.gradient import GradientEffect
 
@@ -64,12 +64,5 @@ class PitchSpectrumAudioEffect(AudioReactiveEffect, GradientEffect):
 
         # Mix in the new color based on the filterbank information and fade out
         # the old colors
-        for index in range(self.pixel_count):
-            #
-            # SLOW SLOW SLOW for loop
-            #
-            new_color = mix_colors(self.pixels[index], note_color, y[index])
-            new_color = mix_colors(
-                new_color, RGB(0, 0, 0), self._config["fade_rate"]
-            )
-            self.pixels[index] = new_color
+        mix_colors_array(self.pixels, note_color, y, out=self.pixels)
+        self.pixels *= 1 - self._config["fade_rate"]
@@ -64,7 +64,7 @@ class PowerAudioEffect(AudioReactiveEffect, GradientEffect):
         # Grab the filtered melbank
         r = self.melbank(filtered=True, size=self.pixel_count)
         # Apply the melbank data to the gradient curve
-        self.bg = self.apply_gradient(r)
+        self.apply_gradient(r, out=self.bg)
 
     def render(self):
         self.pixels = self.bg + self.bass_overlay + self.sparks_overlay
@@ -62,8 +62,7 @@ class RainAudioEffect(AudioReactiveEffect):
     )
 
     def on_activate(self, pixel_count):
-        self.drop_frames = np.zeros(self.pixel_count, dtype=int)
-        self.drop_colors = np.zeros((3, self.pixel_count))
+        self.clear_drops()
 
     def config_updated(self, config):
         self.drop_animation = load_droplet(config["raindrop_animation"])
@@ -71,26 +70,42 @@ class RainAudioEffect(AudioReactiveEffect):
         self.n_frames, self.frame_width = np.shape(self.drop_animation)
         self.frame_centre_index = self.frame_width // 2
         self.frame_side_lengths = self.frame_centre_index - 1
+        self.frame_offsets = np.arange(self.frame_width)
 
         self.intensity_filter = self.create_filter(
             alpha_decay=0.5, alpha_rise=0.99
         )
         self.filtered_intensities = np.zeros(3)
+        if len(getattr(self, "drop_frames", ())) != 3 * self.n_frames:
+            self.clear_drops()
+
+    def clear_drops(self):
+        """
+        Set up the drop pool. At most three drops start per audio frame and
+        each runs for n_frames - 1 frames, so the pool can never run out.
+        Drops with a frame of 0 are free slots.
+        """
+        pool_size = 3 * self.n_frames
+        self.drop_frames = np.zeros(pool_size, dtype=int)
+        self.drop_locations = np.zeros(pool_size, dtype=int)
+        self.drop_colors = np.zeros((pool_size, 3))
 
     def new_drop(self, location, color):
         """
-        Add a new drop animation
-        TODO (?) this method overwrites a running drop animation in the same location
-        would need a significant restructure to fix
+        Add a new drop animation. Drops at the same location overlay each
+        other; if the pool is full, the oldest drop is replaced.
         """
-        self.drop_frames[location] = 1
-        self.drop_colors[:, location] = color
+        free = np.flatnonzero(self.drop_frames == 0)
+        slot = free[0] if len(free) else np.argmax(self.drop_frames)
+        self.drop_frames[slot] = 1
+        self.drop_locations[slot] = location
+        self.drop_colors[slot] = color
 
     def update_drop_frames(self):
         # Set any drops at final frame back to 0 and remove color data
         finished_drops = self.drop_frames >= self.n_frames - 1
         self.drop_frames[finished_drops] = 0
-        self.drop_colors[:, finished_drops] = 0
+        self.drop_colors[finished_drops] = 0
         # Add one to any running frames
         self.drop_frames[self.drop_frames > 0] += 1
 
@@ -99,26 +114,30 @@ class RainAudioEffect(AudioReactiveEffect):
         Get colored pixel data of all drops overlaid
         """
         # 2d array containing color intensity data
-        overlaid_frames = np.zeros((3, self.pixel_count + self.frame_width))
-        # Indexes of active drop animations
-        drop_indices = np.flatnonzero(self.drop_frames)
-        # TODO vectorize this to remove for loop
-        for index in drop_indices:
-            colored_frame = [
-                self.drop_animation[self.drop_frames[index]]
-                * self.drop_colors[color, index]
-                for color in range(3)
-            ]
-            overlaid_frames[
-                :, index : index + self.frame_width
-            ] += colored_frame
+        overlaid_frames = np.zeros((self.pixel_count + self.frame_width, 3))
+        # Pool slots of active drop animations
+        active = np.flatnonzero(self.drop_frames)
+
+        # (drops, frame width, 3) colored animation rows of each drop,
+        # scattered onto the pixels each drop covers
+        colored_frames = (
+            self.drop_animation[self.drop_frames[active]][:, :, np.newaxis]
+            * self.drop_colors[active][:, np.newaxis, :]
+        )
+        covered_pixels = (
+            self.drop_locations[active][:, np.newaxis] + self.frame_offsets
+        )
+        np.add.at(
+            overlaid_frames,
+            covered_pixels.ravel(),
+            colored_frames.reshape(-1, 3),
+        )
 
         np.clip(overlaid_frames, 0, 255, out=overlaid_frames)
         self.pixels = overlaid_frames[
-            :,
             self.frame_side_lengths : self.frame_side_lengths
-            + self.pixel_count,
-        ].T
+            + self.pixel_count
+        ]
 
     def audio_data_updated(self, data):
 
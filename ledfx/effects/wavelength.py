@@ -31,4 +31,4 @@ class WavelengthAudioEffect(AudioReactiveEffect, GradientEffect):
 
     def render(self):
         # Apply the melbank data to the gradient curve and update the pixels
-        self.pixels = self.apply_gradient(self.r)
+        self.apply_gradient(self.r, out=self.pixels)
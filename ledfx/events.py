@@ -1,10 +1,50 @@
 import logging
+import struct
+import threading
+from itertools import count
 from typing import Callable
 
 import numpy as np
 
 _LOGGER = logging.getLogger(__name__)
 
+# Binary visualisation frame header:
+# message type, flags, id length, pixel count
+VISUALISATION_BINARY_HEADER = struct.Struct("<BBBI")
+VISUALISATION_BINARY_TYPE = 1
+VISUALISATION_FLAG_DEVICE = 0x01
+VISUALISATION_FLAG_RLE = 0x02
+VISUALISATION_COMPRESSIONS = {"none": 0, "rle": VISUALISATION_FLAG_RLE}
+
+# Binary graph frames share the visualisation header layout:
+# message type, flags, id length, value count
+GRAPH_BINARY_TYPE = 2
+GRAPH_COMPRESSIONS = {"float16": 0, "uint8": 0x01}
+
+
+def rle_encode_pixels(pixels: np.ndarray) -> bytes:
+    """
+    Run length encodes an (n, 3) uint8 pixel array as consecutive
+    [count, r, g, b] records, with runs capped at 255 pixels
+    """
+    if not len(pixels):
+        return b""
+    changed = np.any(pixels[1:] != pixels[:-1], axis=1)
+    starts = np.flatnonzero(np.concatenate(([True], changed)))
+    lengths = np.diff(np.append(starts, len(pixels)))
+
+    # Split runs longer than 255 into several records
+    chunks = (lengths + 254) // 255
+    run_index = np.repeat(np.arange(len(starts)), chunks)
+    chunk_index = np.arange(chunks.sum()) - np.repeat(
+        np.cumsum(chunks) - chunks, chunks
+    )
+
+    records = np.empty((len(run_index), 4), dtype=np.uint8)
+    records[:, 0] = np.minimum(255, lengths[run_index] - chunk_index * 255)
+    records[:, 1:] = pixels[starts[run_index]]
+    return records.tobytes()
+
 
 class Event:
     """Base for events"""
@@ -31,6 +71,22 @@ class Event:
     def to_dict(self):
         return self.__dict__
 
+    def coalesce_key(self):
+        """
+        Key identifying the stream this event belongs to. High rate events
+        return a key so that only the latest pending event of each stream is
+        delivered to a listener; all other events return None and are always
+        delivered.
+        """
+        return None
+
+    def describe(self):
+        """
+        Static metadata of the event's stream that binary subscribers are
+        sent once, before the first binary frame. None if there is none.
+        """
+        return None
+
 
 class DeviceUpdateEvent(Event):
     """Event emitted when a device's pixels are updated"""
@@ -41,6 +97,9 @@ class DeviceUpdateEvent(Event):
         # self.pixels = pixels.astype(np.uint8).T.tolist()
         self.pixels = pixels
 
+    def coalesce_key(self):
+        return (self.event_type, self.device_id)
+
 
 class DevicesUpdatedEvent(Event):
     """Weird event emitted when OpenRGB device fails to connect"""
@@ -59,6 +118,9 @@ class VirtualUpdateEvent(Event):
         # self.pixels = pixels.astype(np.uint8).T.tolist()
         self.pixels = pixels
 
+    def coalesce_key(self):
+        return (self.event_type, self.virtual_id)
+
 
 class GlobalPauseEvent(Event):
     """Event emitted when all virtuals are paused"""
@@ -94,8 +156,51 @@ class GraphUpdateEvent(Event):
     ):
         super().__init__(Event.GRAPH_UPDATE)
         self.graph_id = graph_id
-        self.melbank = melbank.tolist()
-        self.frequencies = frequencies.tolist()
+        # The melbank buffer is updated in place, the frequencies are static
+        self._melbank = melbank.copy()
+        self._frequencies = frequencies
+        self._encoded = {}
+
+    def coalesce_key(self):
+        return (self.event_type, self.graph_id)
+
+    def to_dict(self):
+        if "json" not in self._encoded:
+            self._encoded["json"] = {
+                "event_type": self.event_type,
+                "graph_id": self.graph_id,
+                "melbank": self._melbank.tolist(),
+                "frequencies": self._frequencies.tolist(),
+            }
+        return self._encoded["json"]
+
+    def describe(self):
+        return {
+            "event_type": self.event_type,
+            "graph_id": self.graph_id,
+            "frequencies": self._frequencies.tolist(),
+        }
+
+    def to_binary(self, compression: str = "float16") -> bytes:
+        """
+        Encodes the melbank as a compact binary websocket message, either
+        as float16 values or as uint8 values scaled from [0, 1]. Cached on
+        the event so every subscriber shares one encoding.
+        """
+        if compression not in self._encoded:
+            graph_id = self.graph_id.encode("utf-8")[:255]
+            header = VISUALISATION_BINARY_HEADER.pack(
+                GRAPH_BINARY_TYPE,
+                GRAPH_COMPRESSIONS[compression],
+                len(graph_id),
+                len(self._melbank),
+            )
+            if compression == "uint8":
+                payload = (np.clip(self._melbank, 0, 1) * 255).astype(np.uint8)
+            else:
+                payload = self._melbank.astype("<f2")
+            self._encoded[compression] = header + graph_id + payload.tobytes()
+        return self._encoded[compression]
 
 
 class VisualisationUpdateEvent(Event):
@@ -111,7 +216,46 @@ class VisualisationUpdateEvent(Event):
         super().__init__(Event.VISUALISATION_UPDATE)
         self.is_device = is_device
         self.vis_id = vis_id
-        self.pixels = pixels.astype(np.uint8).T.tolist()
+        self._pixels = pixels.astype(np.uint8)
+        self._encoded = {}
+
+    def coalesce_key(self):
+        return (self.event_type, self.is_device, self.vis_id)
+
+    def to_dict(self):
+        # Pixels are only converted to nested lists if a JSON subscriber
+        # actually asks for them
+        if "json" not in self._encoded:
+            self._encoded["json"] = {
+                "event_type": self.event_type,
+                "is_device": self.is_device,
+                "vis_id": self.vis_id,
+                "pixels": self._pixels.T.tolist(),
+            }
+        return self._encoded["json"]
+
+    def to_binary(self, compression: str = "none") -> bytes:
+        """
+        Encodes the frame as a compact binary websocket message. The result
+        is cached on the event, so every subscriber shares one encoding.
+        """
+        if compression not in self._encoded:
+            flags = VISUALISATION_COMPRESSIONS[compression]
+            if self.is_device:
+                flags |= VISUALISATION_FLAG_DEVICE
+            vis_id = self.vis_id.encode("utf-8")[:255]
+            header = VISUALISATION_BINARY_HEADER.pack(
+                VISUALISATION_BINARY_TYPE,
+                flags,
+                len(vis_id),
+                len(self._pixels),
+            )
+            if compression == "rle":
+                payload = rle_encode_pixels(self._pixels)
+            else:
+                payload = np.ascontiguousarray(self._pixels).tobytes()
+            self._encoded[compression] = header + vis_id + payload
+        return self._encoded[compression]
 
 
 class EffectSetEvent(Event):
@@ -135,9 +279,11 @@ class EffectClearedEvent(Event):
 class SceneActivatedEvent(Event):
     """Event emitted when a scene is set"""
 
-    def __init__(self, scene_id):
+    def __init__(self, scene_id, latency=None):
         super().__init__(Event.SCENE_ACTIVATED)
         self.scene_id = scene_id
+        # Seconds between the activation request and the switch, if measured
+        self.latency = latency
 
 
 class SceneDeletedEvent(Event):
@@ -165,46 +311,183 @@ class LedFxShutdownEvent(Event):
 
 
 class EventListener:
-    def __init__(self, callback: Callable, event_filter: dict = {}):
+    def __init__(self, callback: Callable, event_filter: dict = None):
         self.callback = callback
-        self.filter = event_filter
+        self.filter = dict(event_filter) if event_filter else {}
 
     def filter_event(self, event):
-        event_dict = event.to_dict()
-        for filter_key in self.filter:
-            if event_dict.get(filter_key) != self.filter[filter_key]:
+        for filter_key, filter_value in self.filter.items():
+            if getattr(event, filter_key, None) != filter_value:
                 return True
 
         return False
 
+    def accepts(self, attributes: dict) -> bool:
+        """Whether an event with these attributes passes the filter"""
+        for filter_key, filter_value in self.filter.items():
+            if attributes.get(filter_key) != filter_value:
+                return False
+
+        return True
+
 
 class Events:
+    # Filter keys that listeners are indexed by, so that per-frame events
+    # only visit the listeners interested in that virtual/device
+    INDEXED_FILTER_KEYS = ("virtual_id", "device_id", "vis_id", "graph_id")
+
     def __init__(self, ledfx):
         self._ledfx = ledfx
+        # {event_type: [listener, ...]} for listeners without an indexed key
         self._listeners = {}
+        # {event_type: {filter_key: {filter_value: [listener, ...]}}}
+        self._indexed_listeners = {}
+        self._listeners_lock = threading.Lock()
+        # Immutable copy of both, swapped in whenever listeners change, so
+        # that render threads can match events while the loop changes them
+        # {event_type: ((listener, ...), {filter_key: {filter_value:
+        # (listener, ...)}})}
+        self._routes = {}
+        # Pending (listener, event) pairs waiting for the next loop wakeup.
+        # Keyed so that coalesced events replace older ones in place.
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._pending_counter = count()
+        self._wakeup_scheduled = False
+        # {event_type: [callback, ...]} notified when listeners change
+        self._listeners_changed_hooks = {}
+
+    @classmethod
+    def _index_key(cls, event_filter):
+        for filter_key in cls.INDEXED_FILTER_KEYS:
+            if isinstance(event_filter.get(filter_key), str):
+                return filter_key
+        return None
+
+    def _rebuild_routes(self) -> None:
+        routes = {}
+        for event_type in self._listeners.keys() | self._indexed_listeners:
+            indexed = self._indexed_listeners.get(event_type, {})
+            routes[event_type] = (
+                tuple(self._listeners.get(event_type, ())),
+                {
+                    filter_key: {
+                        filter_value: tuple(listeners)
+                        for filter_value, listeners in by_value.items()
+                    }
+                    for filter_key, by_value in indexed.items()
+                },
+            )
+        self._routes = routes
+
+    def _matching_listeners(self, event):
+        routes = self._routes.get(event.event_type)
+        if routes is None:
+            return
+        listeners, indexed = routes
+        for listener in listeners:
+            if not listener.filter_event(event):
+                yield listener
+
+        for filter_key, by_value in indexed.items():
+            for listener in by_value.get(getattr(event, filter_key, None), ()):
+                if not listener.filter_event(event):
+                    yield listener
+
+    def has_listeners(self, event_type: str, **attributes) -> bool:
+        """
+        Whether an event of this type with the given attributes would reach
+        any listener. Lets producers skip building events nobody wants.
+        """
+        routes = self._routes.get(event_type)
+        if routes is None:
+            return False
+        if not attributes:
+            return True
+        listeners, indexed = routes
+        for listener in listeners:
+            if listener.accepts(attributes):
+                return True
+
+        for filter_key, by_value in indexed.items():
+            for listener in by_value.get(attributes.get(filter_key), ()):
+                if listener.accepts(attributes):
+                    return True
+
+        return False
+
+    def add_listeners_changed_hook(
+        self, callback: Callable, event_type: str
+    ) -> None:
+        """Calls back whenever a listener for event_type is added or removed"""
+        self._listeners_changed_hooks.setdefault(event_type, []).append(
+            callback
+        )
+
+    def _listeners_changed(self, event_type: str) -> None:
+        for callback in self._listeners_changed_hooks.get(event_type, ()):
+            callback()
 
     def fire_event(self, event: Event) -> None:
+        if event.event_type not in self._routes:
+            return
 
-        listeners = self._listeners.get(event.event_type, [])
+        listeners = list(self._matching_listeners(event))
         if not listeners:
             return
 
-        for listener in listeners:
-            if not listener.filter_event(event):
-                self._ledfx.loop.call_soon_threadsafe(listener.callback, event)
+        coalesce_key = event.coalesce_key()
+        with self._pending_lock:
+            for listener in listeners:
+                if coalesce_key is None:
+                    key = next(self._pending_counter)
+                else:
+                    # Latest value wins: a slow loop only ever sees the most
+                    # recent frame of each stream for each listener
+                    key = (id(listener), coalesce_key)
+                self._pending[key] = (listener, event)
+
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+
+        # One cross-thread handoff per loop iteration, regardless of how
+        # many events and listeners are pending
+        self._ledfx.loop.call_soon_threadsafe(self._dispatch_pending)
+
+    def _dispatch_pending(self) -> None:
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {}
+            self._wakeup_scheduled = False
+
+        for listener, event in pending.values():
+            try:
+                listener.callback(event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error in event listener for %s", event.event_type
+                )
 
     def add_listener(
         self,
         callback: Callable,
         event_type: str,
-        event_filter: dict = {},
+        event_filter: dict = None,
     ) -> None:
 
         listener = EventListener(callback, event_filter)
-        if event_type in self._listeners:
-            self._listeners[event_type].append(listener)
-        else:
-            self._listeners[event_type] = [listener]
+        index_key = self._index_key(listener.filter)
+        with self._listeners_lock:
+            if index_key is None:
+                self._listeners.setdefault(event_type, []).append(listener)
+            else:
+                indexed = self._indexed_listeners.setdefault(event_type, {})
+                indexed.setdefault(index_key, {}).setdefault(
+                    listener.filter[index_key], []
+                ).append(listener)
+            self._rebuild_routes()
+        self._listeners_changed(event_type)
 
         def remove_listener() -> None:
             self._remove_listener(event_type, listener)
@@ -213,12 +496,38 @@ class Events:
 
     def _remove_listener(self, event_type: str, listener: Callable) -> None:
 
-        try:
-            self._listeners[event_type].remove(listener)
-            if not self._listeners[event_type]:
-                self._listeners.pop(event_type)
-        except (KeyError, ValueError):
-            _LOGGER.warning("Failed to remove event listener %s", listener)
+        index_key = self._index_key(listener.filter)
+        with self._listeners_lock:
+            try:
+                if index_key is None:
+                    self._listeners[event_type].remove(listener)
+                    if not self._listeners[event_type]:
+                        self._listeners.pop(event_type)
+                else:
+                    indexed = self._indexed_listeners[event_type]
+                    index_value = listener.filter[index_key]
+                    indexed[index_key][index_value].remove(listener)
+                    if not indexed[index_key][index_value]:
+                        indexed[index_key].pop(index_value)
+                    if not indexed[index_key]:
+                        indexed.pop(index_key)
+                    if not indexed:
+                        self._indexed_listeners.pop(event_type)
+            except (KeyError, ValueError):
+                _LOGGER.warning("Failed to remove event listener %s", listener)
+                return
+            self._rebuild_routes()
+
+        # Drop anything still queued for this listener
+        with self._pending_lock:
+            for key in [
+                key
+                for key, (pending, _) in self._pending.items()
+                if pending is listener
+            ]:
+                del self._pending[key]
+
+        self._listeners_changed(event_type)
 
 
 # def get_event_types():
@@ -301,6 +301,11 @@ class MIDI(Integration):
                         {option: not target._config.get(option)}
                     )
                     if self.input_type == 0
+                    else target.set_parameters({option: value})
+                    # Options without a numeric range are not live
+                    # parameters, and go through the config instead
+                    if self.input_type == 1
+                    and option in target.parameter_ranges()
                     else target.update_config({option: value})
                 ),
                 "schema": Effect.schema().schema,
@@ -0,0 +1,478 @@
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+
+import numpy as np
+
+from ledfx.effects import Effect
+from ledfx.effects.audio import (
+    AUDIO_FRAME_SCALARS,
+    AUDIO_POLL_INTERVAL,
+    SEQLOCK_RETRIES,
+    AudioFrameRing,
+    AudioReactiveEffect,
+    get_audio_source,
+)
+from ledfx.events import Event
+
+_LOGGER = logging.getLogger(__name__)
+
+# How long a worker gets to stop before it is terminated
+WORKER_STOP_TIMEOUT = 2.0
+
+
+class SeqlockBuffer:
+    """
+    A float64 array in shared memory guarded by a sequence counter.
+    There must be a single writer, which makes the counter odd for the
+    duration of a write. Readers copy the data out and retry if the
+    counter was odd or has moved in the meantime.
+    """
+
+    def __init__(self, shape, name=None):
+        self.shape = tuple(shape)
+        size = 8 + 8 * int(np.prod(self.shape))
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._sequence = np.ndarray((1,), dtype=np.int64, buffer=self._shm.buf)
+        self._array = np.ndarray(
+            self.shape, dtype=np.float64, buffer=self._shm.buf, offset=8
+        )
+        # Reads land here first, so a torn read never reaches the caller
+        self._scratch = None
+        if self._owner:
+            self._sequence[0] = 0
+            self._array[:] = 0
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def sequence(self):
+        return int(self._sequence[0])
+
+    def write(self, data):
+        self._sequence[0] += 1
+        np.copyto(self._array, data, casting="unsafe")
+        self._sequence[0] += 1
+
+    def read(self, out):
+        """
+        Copies the latest complete write into out and returns its sequence
+        number, or None and leaves out as it was if the writer kept
+        interrupting the read
+        """
+        if self._scratch is None:
+            self._scratch = np.empty(self.shape)
+        for _ in range(SEQLOCK_RETRIES):
+            sequence = int(self._sequence[0])
+            if sequence & 1:
+                continue
+            np.copyto(self._scratch, self._array)
+            if int(self._sequence[0]) == sequence:
+                np.copyto(out, self._scratch)
+                return sequence
+        return None
+
+    def close(self):
+        # The views have to go before the mapping can be closed
+        self._sequence = None
+        self._array = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+class AudioFrameSource:
+    """
+    Stands in for AudioAnalysisSource inside a render worker. Serves the
+    analysis published through an AudioFrameRing and calls its subscribers
+    once for each new frame.
+    """
+
+    def __init__(self, ring, max_frequencies, melbank_frequencies):
+        self._ring = ring
+        self._frame_index = ring.head
+        self._callbacks = []
+        self._data = np.zeros(ring.frame_size)
+        (
+            self._scalars,
+            self.freq_power_raw,
+            self.freq_power_filtered,
+            melbanks,
+            melbanks_filtered,
+        ) = ring.unpack(self._data)
+        self._scalar_index = {
+            name: i for i, name in enumerate(AUDIO_FRAME_SCALARS)
+        }
+        self.melbanks = SimpleNamespace(
+            _config={"max_frequencies": max_frequencies},
+            melbank_processors=tuple(
+                SimpleNamespace(melbank_frequencies=frequencies)
+                for frequencies in melbank_frequencies
+            ),
+            melbanks=tuple(melbanks),
+            melbanks_filtered=tuple(melbanks_filtered),
+        )
+
+    def _scalar(self, name):
+        return self._scalars[self._scalar_index[name]]
+
+    def poll(self):
+        """Runs the subscribers for every frame published since last poll"""
+        for self._frame_index in self._ring.frames_since(
+            self._frame_index, self._data
+        ):
+            for callback in self._callbacks:
+                callback()
+
+    def subscribe(self, callback):
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    @property
+    def beat_counter(self):
+        return int(self._scalar("beat_counter"))
+
+    def volume(self, filtered=True):
+        return self._scalar("volume" if filtered else "volume_raw")
+
+    def pitch(self):
+        return self._scalar("pitch")
+
+    def onset(self):
+        return bool(self._scalar("onset"))
+
+    def bpm_beat_now(self):
+        return bool(self._scalar("bpm_beat_now"))
+
+    def volume_beat_now(self):
+        return bool(self._scalar("volume_beat_now"))
+
+    def bar_oscillator(self):
+        return self._scalar("bar_oscillator")
+
+    def beat_oscillator(self):
+        return self.bar_oscillator() % 1
+
+    def get_freq_power(self, i, filtered=True):
+        if filtered:
+            return self.freq_power_filtered[i]
+        return self.freq_power_raw[i]
+
+    def beat_power(self, filtered=True):
+        return self.get_freq_power(0, filtered)
+
+    def bass_power(self, filtered=True):
+        return self.get_freq_power(1, filtered)
+
+    def lows_power(self, filtered=True):
+        return (
+            self.get_freq_power(0, filtered) + self.get_freq_power(1, filtered)
+        ) * 0.5
+
+    def mids_power(self, filtered=True):
+        return self.get_freq_power(2, filtered)
+
+    def high_power(self, filtered=True):
+        return self.get_freq_power(3, filtered)
+
+
+def _render_worker(
+    effect_cls,
+    config,
+    ledfx_state,
+    virtual_state,
+    pixels_name,
+    audio_state,
+    commands,
+):
+    """
+    Entry point of a render worker process. Renders the effect at the
+    virtual's refresh rate into the shared pixel buffer until told to stop.
+    """
+    virtual = SimpleNamespace(**virtual_state)
+    pixels = SeqlockBuffer((virtual.pixel_count, 3), pixels_name)
+    effect = effect_cls(SimpleNamespace(**ledfx_state), config)
+
+    ring = None
+    audio = None
+    if audio_state is not None:
+        ring = AudioFrameRing.attach(audio_state["name"])
+        audio = AudioFrameSource(
+            ring,
+            audio_state["max_frequencies"],
+            audio_state["melbank_frequencies"],
+        )
+        # AudioReactiveEffect.activate would open an audio stream of its
+        # own, so activate as a plain effect and attach the shared frames
+        Effect.activate(effect, virtual)
+        effect.audio = audio
+        audio.subscribe(effect._audio_data_updated)
+    else:
+        effect.activate(virtual)
+
+    interval = 1 / virtual.refresh_rate
+    next_render = time.perf_counter()
+    try:
+        while True:
+            if audio is not None:
+                audio.poll()
+
+            now = time.perf_counter()
+            if now >= next_render:
+                # Drain every command, live parameters can arrive faster
+                # than frames are rendered
+                stopping = False
+                while True:
+                    try:
+                        command, payload = commands.get_nowait()
+                    except queue.Empty:
+                        break
+                    if command == "stop":
+                        stopping = True
+                        break
+                    if command == "config":
+                        effect.update_config(payload)
+                    elif command == "parameters":
+                        effect.set_parameters(payload)
+                    elif command == "frequency_range":
+                        virtual.frequency_range = payload
+                        if hasattr(effect, "clear_melbank_freq_props"):
+                            effect.clear_melbank_freq_props()
+                if stopping:
+                    break
+
+                effect._render()
+                rendered = effect.get_pixels()
+                if rendered is not None:
+                    pixels.write(rendered)
+                next_render = max(next_render + interval, now)
+
+            # Audio frames are polled for in between renders, other effects
+            # only have to wake for their next frame
+            wait = next_render - time.perf_counter()
+            if audio is not None:
+                wait = min(wait, AUDIO_POLL_INTERVAL)
+            time.sleep(max(0, wait))
+    finally:
+        effect.deactivate()
+        pixels.close()
+        if ring is not None:
+            ring.close()
+
+
+class ProcessEffect:
+    """
+    Runs an effect in a render worker process. The virtual sees an effect
+    whose pixels are the latest frame the worker wrote to shared memory.
+    Everything else, such as the id, type and validated config, comes
+    from the wrapped effect, which is never activated in this process.
+    """
+
+    def __init__(self, pool, effect):
+        self._pool = pool
+        self._effect = effect
+        self._virtual = None
+        self._worker = None
+        self._commands = None
+        self._pixels_buffer = None
+        self.pixels = None
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self._effect, name)
+
+    @property
+    def audio_reactive(self):
+        return isinstance(self._effect, AudioReactiveEffect)
+
+    def activate(self, virtual):
+        self._virtual = virtual
+        self.pixels = np.zeros((virtual.pixel_count, 3))
+        self._pixels_buffer = SeqlockBuffer(self.pixels.shape)
+        self._commands = self._pool.context.Queue()
+        self._pool.attach(self)
+
+        audio_state = self._pool.audio_state() if self.audio_reactive else None
+        ledfx = self._pool.ledfx
+        self._worker = self._pool.context.Process(
+            target=_render_worker,
+            args=(
+                type(self._effect),
+                self._effect._config,
+                {
+                    "colors": {
+                        name: ledfx.colors[name] for name in ledfx.colors
+                    },
+                },
+                {
+                    "id": virtual.id,
+                    "pixel_count": virtual.pixel_count,
+                    "refresh_rate": virtual.refresh_rate,
+                    "frequency_range": virtual.frequency_range,
+                    "matrix_shape": virtual.matrix_shape,
+                    "matrix_index": virtual.matrix_index,
+                },
+                self._pixels_buffer.name,
+                audio_state,
+                self._commands,
+            ),
+            name=f"LedFx render {virtual.id}",
+            daemon=True,
+        )
+        self._worker.start()
+        _LOGGER.info(
+            f"Effect {self._effect.NAME} rendering in worker process {self._worker.pid}."
+        )
+
+    def deactivate(self):
+        if self._worker is not None:
+            self._commands.put(("stop", None))
+            self._worker.join(WORKER_STOP_TIMEOUT)
+            if self._worker.is_alive():
+                _LOGGER.warning(
+                    f"Render worker {self._worker.pid} did not stop, terminating it."
+                )
+                self._worker.terminate()
+                self._worker.join()
+            self._worker = None
+            self._commands.close()
+            self._commands = None
+        with self.lock:
+            if self._pixels_buffer is not None:
+                self._pixels_buffer.close()
+                self._pixels_buffer = None
+            self.pixels = None
+        self._pool.detach(self)
+
+    @property
+    def is_active(self):
+        return self._worker is not None and self._worker.is_alive()
+
+    def _render(self):
+        # Keeps the previous frame if the worker is mid-write
+        with self.lock:
+            if self._pixels_buffer is not None:
+                self._pixels_buffer.read(self.pixels)
+
+    def render(self):
+        self._render()
+
+    def get_pixels(self):
+        # Output filters were already applied by the worker
+        return np.copy(self.pixels)
+
+    def update_config(self, config):
+        self._effect.update_config(config)
+        if self._commands is not None:
+            self._commands.put(("config", self._effect._config))
+
+    def set_parameters(self, parameters):
+        parameters = self._effect.check_parameters(parameters)
+        # Keeps this copy of the config current for scenes and the API
+        self._effect._config = {**self._effect._config, **parameters}
+        if self._commands is not None:
+            self._commands.put(("parameters", parameters))
+        return parameters
+
+    def clear_melbank_freq_props(self):
+        if self._commands is not None:
+            self._commands.put(
+                ("frequency_range", self._virtual.frequency_range)
+            )
+
+
+class RenderPool:
+    """
+    Hands effects of virtuals with render_process enabled to worker
+    processes, up to the configured number of workers. Publishes the
+    audio analysis to the workers while any of them is audio reactive.
+    """
+
+    def __init__(self, ledfx):
+        self.ledfx = ledfx
+        self.context = multiprocessing.get_context("spawn")
+        self._effects = []
+        self._audio = None
+        self._audio_ring = None
+
+        def shutdown(e):
+            self.shutdown()
+
+        self.ledfx.events.add_listener(shutdown, Event.LEDFX_SHUTDOWN)
+
+    @property
+    def max_workers(self):
+        return self.ledfx.config["render_workers"] or max(
+            1, (os.cpu_count() or 2) - 1
+        )
+
+    def wrap(self, effect):
+        """Returns a ProcessEffect for the effect, if a worker is free"""
+        if len(self._effects) >= self.max_workers:
+            _LOGGER.warning(
+                f"All {self.max_workers} render workers are busy, rendering {effect.NAME} in its virtual's thread."
+            )
+            return effect
+        return ProcessEffect(self, effect)
+
+    def attach(self, effect):
+        self._effects.append(effect)
+
+    def detach(self, effect):
+        if effect in self._effects:
+            self._effects.remove(effect)
+        if self._audio_ring is not None and not any(
+            e.audio_reactive for e in self._effects
+        ):
+            self._audio.unsubscribe(self._publish_audio)
+            self._audio_ring.close()
+            self._audio_ring = None
+            self._audio = None
+
+    def audio_state(self):
+        """Starts publishing audio frames and describes them for a worker"""
+        if self._audio_ring is None:
+            self._audio = get_audio_source(self.ledfx)
+            self._audio_ring = AudioFrameRing.create(
+                self._audio.melbanks.mel_count, self._audio.melbanks.mel_len
+            )
+            self._audio.subscribe(self._publish_audio)
+
+        melbanks = self._audio.melbanks
+        return {
+            "name": self._audio_ring.name,
+            "max_frequencies": melbanks._config["max_frequencies"],
+            "melbank_frequencies": [
+                processor.melbank_frequencies
+                for processor in melbanks.melbank_processors
+            ],
+        }
+
+    def _publish_audio(self):
+        # Read once, detach may close the ring from the loop meanwhile
+        ring = self._audio_ring
+        audio = self._audio
+        if ring is None or audio is None:
+            return
+        if ring.mel_count != audio.melbanks.mel_count:
+            # Melbanks were reconfigured, workers pick this up on restart
+            return
+        ring.publish(audio)
+
+    def shutdown(self):
+        for effect in list(self._effects):
+            effect.deactivate()
@@ -1,4 +1,6 @@
 import logging
+import threading
+import time
 
 import voluptuous as vol
 
@@ -17,6 +19,9 @@ class Scenes:
     def __init__(self, ledfx):
         self._ledfx = ledfx
         self._scenes = self._ledfx.config["scenes"]
+        # Effects built ahead of activation: scene id -> (scene, effects)
+        self._prewarmed = {}
+        self._prewarm_lock = threading.Lock()
 
         def virtuals_validator(virtual_ids):
             return list(
@@ -52,6 +57,10 @@ class Scenes:
             }
         )
 
+        if self._ledfx.config["scene_prewarm"]:
+            for scene_id in self._scenes:
+                self.request_prewarm(scene_id)
+
     def save_to_config(self):
         self._ledfx.config["scenes"] = self._scenes
         save_config(
@@ -84,36 +93,138 @@ class Scenes:
         # Update the scene if it already exists, else create it
         self._scenes[scene_id] = scene_config
         self.save_to_config()
+        self.discard_prewarmed(scene_id)
+        if self._ledfx.config["scene_prewarm"]:
+            self.request_prewarm(scene_id)
 
     def activate(self, scene_id):
-        """Activate a scene"""
+        """
+        Activate a scene. All of its effects are built and activated first,
+        then the virtuals are switched over together, each at the start of
+        its next frame.
+        """
+        requested = time.perf_counter()
         scene = self.get(scene_id)
         if not scene:
             _LOGGER.error(f"No scene found with id: {scene_id}")
             return
 
-        for virtual_id in scene["virtuals"]:
-            virtual = self._ledfx.virtuals.get(virtual_id)
-            if not virtual:
-                # virtual has been deleted since scene was created
-                # remove from scene?
+        effects = self._take_prewarmed(scene_id, scene)
+        if effects is None:
+            effects = self._create_effects(scene)
+
+        changes = []
+        try:
+            for virtual_id, effect in effects.items():
+                virtual = self._ledfx.virtuals.get(virtual_id)
+                if not virtual:
+                    # virtual has been deleted since scene was created
+                    self._destroy_effects({virtual_id: effect})
+                    continue
+                # Set effect of virtual to that saved in the scene,
+                # clear active effect of virtual if no effect in scene
+                if effect is not None:
+                    effect = virtual.prepare_effect(effect)
+                changes.append((virtual, effect))
+        except Exception:
+            # Leave every virtual as it was rather than half switching
+            for virtual, effect in changes:
+                if effect is not None:
+                    effect.deactivate()
+            self._destroy_effects(effects)
+            raise
+
+        switching = time.perf_counter()
+        for virtual, effect in changes:
+            if effect is not None:
+                virtual.commit_effect(effect)
+            else:
+                virtual.clear_effect()
+        switched = time.perf_counter()
+
+        latency = switched - requested
+        _LOGGER.info(
+            f"Activated scene {scene_id} on {len(changes)} virtuals in "
+            f"{latency * 1000:.1f} ms, switching them within "
+            f"{(switched - switching) * 1000:.1f} ms."
+        )
+        self._ledfx.events.fire_event(SceneActivatedEvent(scene_id, latency))
+
+        if self._ledfx.config["scene_prewarm"]:
+            self.request_prewarm(scene_id)
+
+    def _create_effects(self, scene):
+        """Builds the inactive effects of a scene by virtual id"""
+        effects = {}
+        for virtual_id, effect_config in scene["virtuals"].items():
+            if not self._ledfx.virtuals.get(virtual_id):
                 continue
-            # Set effect of virtual to that saved in the scene,
-            # clear active effect of virtual if no effect in scene
-            if scene["virtuals"][virtual.id]:
-                # Create the effect and add it to the virtual
-                effect = self._ledfx.effects.create(
+            if effect_config:
+                effects[virtual_id] = self._ledfx.effects.create(
                     ledfx=self._ledfx,
-                    type=scene["virtuals"][virtual.id]["type"],
-                    config=scene["virtuals"][virtual.id]["config"],
+                    type=effect_config["type"],
+                    config=effect_config["config"],
                 )
-                virtual.set_effect(effect)
             else:
-                virtual.clear_effect()
-        self._ledfx.events.fire_event(SceneActivatedEvent(scene_id))
+                effects[virtual_id] = None
+        return effects
+
+    def prewarm(self, scene_id):
+        """Builds the effects of a scene ahead of its activation"""
+        scene = self.get(scene_id)
+        if not scene:
+            return
+        effects = self._create_effects(scene)
+        with self._prewarm_lock:
+            # The scene was replaced or deleted while its effects were built
+            if self.get(scene_id) is not scene:
+                stale = (scene, effects)
+            else:
+                stale = self._prewarmed.pop(scene_id, None)
+                self._prewarmed[scene_id] = (scene, effects)
+        if stale is not None:
+            self._destroy_effects(stale[1])
+
+    def request_prewarm(self, scene_id):
+        """
+        Prewarms a scene on the loop, which owns the effects registry, once
+        it is done with what it is doing now
+        """
+        self._ledfx.loop.call_soon_threadsafe(self._prewarm_soon, scene_id)
+
+    def _prewarm_soon(self, scene_id):
+        try:
+            self.prewarm(scene_id)
+        except Exception as e:
+            _LOGGER.warning(f"Unable to prewarm scene {scene_id}: {e}")
+
+    def discard_prewarmed(self, scene_id):
+        """Drops the effects built ahead for a scene"""
+        with self._prewarm_lock:
+            prewarmed = self._prewarmed.pop(scene_id, None)
+        if prewarmed is not None:
+            self._destroy_effects(prewarmed[1])
+
+    def _take_prewarmed(self, scene_id, scene):
+        with self._prewarm_lock:
+            prewarmed = self._prewarmed.pop(scene_id, None)
+        if prewarmed is None:
+            return None
+        prewarmed_scene, effects = prewarmed
+        # The scene was replaced since it was prewarmed
+        if prewarmed_scene is not scene:
+            self._destroy_effects(effects)
+            return None
+        return effects
+
+    def _destroy_effects(self, effects):
+        for effect in effects.values():
+            if effect is not None and self._ledfx.effects.get(effect.id):
+                self._ledfx.effects.destroy(effect.id)
 
     def destroy(self, scene_id):
         """Deletes a scene"""
+        self.discard_prewarmed(scene_id)
 
         if not self._scenes.pop(scene_id, None):
             _LOGGER.error("Cannot delete non-existent scene id: {scene_id}")
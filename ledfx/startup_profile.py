@@ -0,0 +1,108 @@
+"""
+Startup profiling for --profile-startup. Times every module import and the
+startup stages of the core, then reports the slowest of them. This has no
+LedFx imports of its own, so that it can start before LedFx is imported.
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Imports and stages listed in the report
+REPORT_LENGTH = 40
+
+_local = threading.local()
+_imports = {}
+_stages = []
+_started = None
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _timed_exec_module(name, exec_module):
+    def exec_timed(module):
+        stack = _stack()
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += total
+            _imports[name] = (total - children, total)
+
+    return exec_timed
+
+
+class _ImportTimer:
+    """Meta path finder that times the execution of the modules it finds"""
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            # Builtin and frozen loaders are classes shared by all modules
+            if (
+                loader is not None
+                and not isinstance(loader, type)
+                and hasattr(loader, "exec_module")
+            ):
+                loader.exec_module = _timed_exec_module(
+                    name, loader.exec_module
+                )
+            return spec
+        return None
+
+
+def start():
+    """Starts timing imports, before anything worth timing is imported"""
+    global _started
+    if _started is None:
+        _started = time.perf_counter()
+        sys.meta_path.insert(0, _ImportTimer())
+
+
+def active() -> bool:
+    return _started is not None
+
+
+@contextmanager
+def stage(name):
+    """Times a startup stage of the core"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if active():
+            _stages.append((name, time.perf_counter() - start))
+
+
+def report() -> str:
+    """Returns a report of the startup stages and the slowest imports"""
+    lines = [
+        f"Startup took {time.perf_counter() - _started:.3f}s",
+        "",
+        "Stages:",
+    ]
+    for name, seconds in _stages:
+        lines.append(f"  {seconds * 1000:9.1f} ms  {name}")
+
+    lines += [
+        "",
+        f"Slowest of {len(_imports)} imports (self, cumulative):",
+    ]
+    slowest = sorted(_imports.items(), key=lambda item: -item[1][0])
+    for name, (own, total) in slowest[:REPORT_LENGTH]:
+        lines.append(f"  {own * 1000:9.1f} ms {total * 1000:9.1f} ms  {name}")
+    return "\n".join(lines)
@@ -1,25 +1,31 @@
 import asyncio
 import concurrent.futures
+import copy
+import hashlib
 import importlib
+import importlib.util
 import inspect
 import ipaddress
+import json
 import logging
 import os
 import pkgutil
 import re
 import socket
 import sys
+import threading
 import time
 from abc import ABC
+from collections import OrderedDict
 from collections.abc import MutableMapping
-from functools import lru_cache
+from functools import lru_cache, partial
 from itertools import chain
 
 # from asyncio import coroutines, ensure_future
 from subprocess import PIPE, Popen, check_output
 
+import aiohttp
 import numpy as np
-import requests
 import voluptuous as vol
 
 from ledfx.config import save_config
@@ -183,17 +189,42 @@ def git_version():
     return check_output(["git", "rev-parse", "HEAD"]).strip().decode("ascii")
 
 
+# Connections the shared WLED session keeps open, in total and per device
+WLED_CONNECTION_LIMIT = 32
+WLED_CONNECTION_LIMIT_PER_HOST = 2
+
+
 class WLED:
     """
     A collection of WLED helper functions
     """
 
     SYNC_MODES = {"DDP": 4048, "E131": 5568, "ARTNET": 6454}
+    # Pooled HTTP session shared by all WLED devices
+    _session = None
 
     def __init__(self, ip_address):
         self.ip_address = ip_address
         self.reboot_flag = False
 
+    @classmethod
+    def session(cls):
+        """Returns the shared session, creating it in the running loop"""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=WLED_CONNECTION_LIMIT,
+                    limit_per_host=WLED_CONNECTION_LIMIT_PER_HOST,
+                )
+            )
+        return cls._session
+
+    @classmethod
+    async def close_session(cls):
+        if cls._session is not None:
+            await cls._session.close()
+            cls._session = None
+
     async def get_sync_settings(self):
         self.sync_settings = await WLED._get_sync_settings(self.ip_address)
 
@@ -201,28 +232,31 @@ class WLED:
     async def _wled_request(
         method, ip_address, endpoint, timeout=0.5, **kwargs
     ):
-        url = f"http://{ip_address}/{endpoint}"
+        """Returns the decoded json response of GET requests"""
+        url = f"http://{ip_address}/{endpoint.lstrip('/')}"
 
         try:
-            response = method(url, timeout=timeout, **kwargs)
-
-        except requests.exceptions.RequestException:
+            async with WLED.session().request(
+                method,
+                url,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                **kwargs,
+            ) as response:
+                if not response.ok:
+                    msg = f"WLED {ip_address}: API Error - {response.status}"
+                    raise ValueError(msg)
+                if method != "GET":
+                    return None
+                return await response.json(content_type=None)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             msg = f"WLED {ip_address}: Failed to connect"
             raise ValueError(msg)
 
-        if not response.ok:
-            msg = f"WLED {ip_address}: API Error - {response.status_code}"
-            raise ValueError(msg)
-
-        return response
-
     @staticmethod
     async def _get_sync_settings(ip_address):
 
-        response = await WLED._wled_request(
-            requests.get, ip_address, "json/cfg"
-        )
-        return response.json()
+        return await WLED._wled_request("GET", ip_address, "json/cfg")
 
     async def flush_sync_settings(self):
         """
@@ -232,10 +266,10 @@ class WLED:
         # if self.reboot_flag:
         #     self.sync_settings["rb"] = True
         await WLED._wled_request(
-            requests.post,
+            "POST",
             self.ip_address,
             "json/cfg",
-            data=self.sync_settings,
+            json=self.sync_settings,
         )
         self.reboot_flag = False
 
@@ -251,12 +285,10 @@ class WLED:
         _LOGGER.info(
             f"WLED {self.ip_address}: Attempting to contact device..."
         )
-        response = await WLED._wled_request(
-            requests.get, self.ip_address, "json/info"
+        wled_config = await WLED._wled_request(
+            "GET", self.ip_address, "json/info"
         )
 
-        wled_config = response.json()
-
         if not wled_config["brand"] in "WLED":
             msg = f"WLED {self.ip_address}: Not a compatible WLED brand '{wled_config['brand']}'"
             raise ValueError(msg)
@@ -272,11 +304,7 @@ class WLED:
         Returns:
             state, dict. Full device state
         """
-        response = await WLED._wled_request(
-            requests.get, self.ip_address, "json/state"
-        )
-
-        return response.json()
+        return await WLED._wled_request("GET", self.ip_address, "json/state")
 
     async def get_power_state(self):
         """
@@ -309,7 +337,7 @@ class WLED:
         """
         power = {"on": True if state else False}
         await WLED._wled_request(
-            requests.post, self.ip_address, "/json/state", data=power
+            "POST", self.ip_address, "/json/state", json=power
         )
 
         _LOGGER.info(
@@ -329,7 +357,7 @@ class WLED:
         bri = {"bri": brightness}
 
         await WLED._wled_request(
-            requests.post, self.ip_address, "/json/state", data=bri
+            "POST", self.ip_address, "/json/state", json=bri
         )
 
         _LOGGER.info(
@@ -464,11 +492,11 @@ class WLED:
         """
         reboot = {"rb": True}
         await WLED._wled_request(
-            requests.post,
+            "POST",
             self.ip_address,
             "/json/state",
             timeout=3,
-            data=reboot,
+            json=reboot,
         )
 
 
@@ -483,10 +511,98 @@ def empty_queue(queue: asyncio.Queue):
         queue.task_done()
 
 
+# How long resolved addresses are served before being refreshed, and how
+# long failed lookups are remembered, in seconds
+DNS_CACHE_TTL = 300
+DNS_NEGATIVE_TTL = 10
+
+
+class DNSCache:
+    """
+    Caches the addresses of device hostnames. Addresses past their TTL are
+    still served while a lookup refreshes them in the background, and kept
+    if that refresh fails. Failed lookups are remembered for a while, and
+    concurrent lookups of a hostname share a single query. Zeroconf
+    announcements update entries directly.
+    """
+
+    def __init__(self):
+        # hostname: (address, or None for a failed lookup, expiry)
+        self._entries = {}
+        # hostname: future of the lookup in progress
+        self._lookups = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(hostname):
+        return hostname.rstrip(".").lower()
+
+    def update(self, hostname, address, ttl=DNS_CACHE_TTL):
+        """Caches the address of hostname, safe to call from any thread"""
+        with self._lock:
+            self._entries[self._key(hostname)] = (
+                address,
+                time.monotonic() + ttl,
+            )
+
+    def invalidate(self, hostname):
+        with self._lock:
+            self._entries.pop(self._key(hostname), None)
+
+    async def resolve(self, loop, executor, hostname, timeout=3):
+        key = self._key(hostname)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            address, expiry = entry
+            expired = time.monotonic() >= expiry
+            if address is not None:
+                if expired:
+                    self._lookup(loop, executor, key)
+                return address
+            if not expired:
+                raise ValueError(f"Failed to resolve destination {key}")
+
+        lookup = self._lookup(loop, executor, key)
+        try:
+            # Shielded, so a timed out caller leaves the lookup to finish
+            return await asyncio.wait_for(asyncio.shield(lookup), timeout)
+        except (OSError, UnicodeError, asyncio.TimeoutError):
+            raise ValueError(f"Failed to resolve destination {key}")
+
+    def _lookup(self, loop, executor, key):
+        lookup = self._lookups.get(key)
+        if lookup is None:
+            lookup = loop.run_in_executor(executor, socket.gethostbyname, key)
+            lookup.add_done_callback(partial(self._lookup_done, key))
+            self._lookups[key] = lookup
+        return lookup
+
+    def _lookup_done(self, key, lookup):
+        del self._lookups[key]
+        if lookup.cancelled():
+            return
+        if lookup.exception() is None:
+            _LOGGER.debug(f"Resolved {key} to {lookup.result()}")
+            self.update(key, lookup.result())
+        else:
+            _LOGGER.debug(f"Failed to resolve {key}: {lookup.exception()}")
+            with self._lock:
+                address, _ = self._entries.get(key, (None, 0))
+            # A failed refresh keeps serving the last address it had, and
+            # is retried once the negative TTL is up
+            self.update(key, address, DNS_NEGATIVE_TTL)
+
+
+dns_cache = DNSCache()
+
+
 async def resolve_destination(
     loop, executor, destination, port=7777, timeout=3
 ):
-    """Uses asyncio's non blocking DNS funcs to attempt domain lookup
+    """Uses asyncio's non blocking DNS funcs to attempt domain lookup.
+    Hostnames are looked up through the shared dns_cache.
 
     Args:
         loop: ledfx event loop (ledfx.loop)
@@ -496,24 +612,14 @@ async def resolve_destination(
 
     Returns:
         On success: string containing the resolved IP address.
-        On failure: boolean false.
+        On failure: raises ValueError.
     """
     try:
         ipaddress.ip_address(destination)
         return destination
 
     except ValueError:
-        cleaned_dest = destination.rstrip(".")
-        try:
-            dest = await loop.run_in_executor(
-                executor, socket.gethostbyname, cleaned_dest
-            )
-            _LOGGER.debug(f"Resolved {cleaned_dest} to {dest}")
-            return dest
-            # dest = await loop.getaddrinfo(cleaned_dest, port)
-            # return dest[0][4][0]
-        except socket.gaierror as e:
-            raise ValueError(f"Failed to resolve destination {cleaned_dest}")
+        return await dns_cache.resolve(loop, executor, destination, timeout)
 
 
 def currently_frozen():
@@ -656,6 +762,24 @@ class RollingQueueHandler(logging.handlers.QueueHandler):
             self.enqueue(record)
 
 
+# Number of validated configs kept, for configs that are validated again
+VALIDATION_CACHE_SIZE = 256
+
+
+def freeze_config(value):
+    """
+    Returns a hashable copy of a json-like config. Scalars keep their type,
+    so that a cached result for True is never reused for 1.
+    """
+    if isinstance(value, dict):
+        return frozenset(
+            (key, freeze_config(item)) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze_config(item) for item in value))
+    return (type(value), value)
+
+
 class BaseRegistry(ABC):
     """
     Base registry class used for effects and devices. This maintains a
@@ -668,6 +792,11 @@ class BaseRegistry(ABC):
     """
 
     _schema_attr = "CONFIG_SCHEMA"
+    # Extended schemas and validated configs by class. Classes with a schema
+    # property are never cached, as that schema can change at runtime.
+    _schemas = {}
+    _validated = OrderedDict()
+    _validated_lock = threading.Lock()
 
     def __init_subclass__(cls, **kwargs):
         """Automatically register the class"""
@@ -704,18 +833,56 @@ class BaseRegistry(ABC):
                 type(self), self._schema_attr, vol.Schema({})
             )
 
+        schema = BaseRegistry._schemas.get((self, extra))
+        if schema is not None:
+            return schema
+
         schema = vol.Schema({}, extra=extra)
+        static = True
         classes = inspect.getmro(self)[::-1]
         for c in classes:
             c_schema = getattr_explicit(c, self._schema_attr, None)
             if c_schema is not None:
                 if type(c_schema) is property:
                     schema = schema.extend(c_schema.fget().schema)
+                    static = False
                 else:
                     schema = schema.extend(c_schema.schema)
 
+        if static:
+            BaseRegistry._schemas[(self, extra)] = schema
         return schema
 
+    @classmethod
+    def validate_config(self, config):
+        """
+        Validates a config against the extended schema of the class. The
+        result is reused when the same config is validated again.
+        """
+        schema = self.schema()
+        if (self, vol.ALLOW_EXTRA) not in BaseRegistry._schemas:
+            return schema(config)
+
+        try:
+            key = (self, freeze_config(config))
+            hash(key)
+        except TypeError:
+            return schema(config)
+
+        with BaseRegistry._validated_lock:
+            validated = BaseRegistry._validated.get(key)
+            if validated is not None:
+                BaseRegistry._validated.move_to_end(key)
+        if validated is None:
+            validated = schema(config)
+            with BaseRegistry._validated_lock:
+                BaseRegistry._validated[key] = validated
+                if len(BaseRegistry._validated) > VALIDATION_CACHE_SIZE:
+                    BaseRegistry._validated.popitem(last=False)
+        # Callers are free to change the config they get back, nested
+        # values included, without touching the cached copy
+        return copy.deepcopy(validated)
+
     @classmethod
     def registry(self):
         """Returns all the subclasses in the registry"""
@@ -744,8 +911,54 @@ class BaseRegistry(ABC):
         return setattr(self, "_config", _config)
 
 
+# Generated by generate_registry_manifest.py, lists the modules of each
+# registry package with a hash of their source, and the registry types with
+# the module each comes from and its metadata
+REGISTRY_MANIFEST_FILE = os.path.join(
+    os.path.dirname(__file__), "registry_manifest.json"
+)
+# Class attributes kept in the manifest as the metadata of a type
+REGISTRY_MANIFEST_ATTRS = ("NAME", "CATEGORY", "DESCRIPTION")
+
+
+@lru_cache(maxsize=None)
+def load_registry_manifest():
+    try:
+        with open(REGISTRY_MANIFEST_FILE, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        _LOGGER.debug(f"No registry manifest, importing all modules: {e}")
+        return {}
+
+
+def build_registry_manifest_entry(package, cls):
+    """Imports every module of a registry's package and describes its types"""
+    modules = RegistryLoader.module_hashes(package)
+    for name in modules:
+        importlib.import_module(name)
+
+    types = {
+        type: registry_metadata(type_cls)
+        for type, type_cls in cls.registry().items()
+    }
+    return {"modules": modules, "types": types}
+
+
+def registry_metadata(cls):
+    metadata = {"module": cls.__module__}
+    for attr in REGISTRY_MANIFEST_ATTRS:
+        value = getattr(cls, attr, None)
+        if isinstance(value, str):
+            metadata[attr.lower()] = value
+    return metadata
+
+
 class RegistryLoader:
-    """Manages loading of components for a given registry"""
+    """
+    Manages loading of components for a given registry. When the registry
+    manifest matches the package, modules are only imported when one of
+    their types is first used, rather than all of them at startup.
+    """
 
     def __init__(self, ledfx, cls, package):
         self._package = package
@@ -754,7 +967,15 @@ class RegistryLoader:
         self._object_id = 1
 
         self._ledfx = ledfx
-        self.import_registry(package)
+        self._manifest = None
+        if not ledfx.dev_enabled():
+            manifest = load_registry_manifest().get(package)
+            if manifest is not None and self._manifest_current(
+                manifest, package
+            ):
+                self._manifest = manifest
+        if self._manifest is None:
+            self.import_registry(package)
 
         # If running in developer mode autoreload the registry when any file
         # within the package changes.
@@ -797,7 +1018,8 @@ class RegistryLoader:
         for name in found:
             importlib.import_module(name)
 
-    def discover_modules(self, package):
+    @staticmethod
+    def discover_modules(package):
         """Discovers all modules in the package"""
         module = importlib.import_module(package)
 
@@ -807,19 +1029,70 @@ class RegistryLoader:
 
         return found
 
+    @staticmethod
+    def module_hashes(package):
+        """Hashes the source of each module in the package, by module name"""
+        hashes = {}
+        for name in RegistryLoader.discover_modules(package):
+            spec = importlib.util.find_spec(name)
+            try:
+                with open(spec.origin, "rb") as file:
+                    hashes[name] = hashlib.sha1(file.read()).hexdigest()
+            except (OSError, TypeError):
+                hashes[name] = None
+        return hashes
+
+    def _manifest_current(self, manifest, package):
+        """
+        Whether the manifest still describes the package. Any module added,
+        removed or changed since it was generated could have changed the
+        types, so the registry is then imported instead.
+        """
+        if currently_frozen():
+            # The bundle cannot change after the manifest was generated
+            return set(manifest["modules"]) == set(
+                self.discover_modules(package)
+            )
+        hashes = self.module_hashes(package)
+        if manifest["modules"] != hashes:
+            _LOGGER.debug(f"Registry manifest of {package} is out of date")
+            return False
+        return True
+
     def __iter__(self):
         return iter(self._objects)
 
     def types(self):
         """Returns all the type strings in the registry"""
+        if self._manifest is not None:
+            return list(self._manifest["types"].keys())
         return list(self._cls.registry().keys())
 
+    def metadata(self, type):
+        """
+        Returns the module, name, category and description of a type,
+        without importing its module
+        """
+        if self._manifest is not None:
+            return self._manifest["types"][type]
+        return registry_metadata(self.get_class(type))
+
     def classes(self):
         """Returns all the classes in the registry"""
+        if self._manifest is not None:
+            self.import_registry(self._package)
+            self._manifest = None
         return self._cls.registry()
 
     def get_class(self, type):
-        return self._cls.registry()[type]
+        registry = self._cls.registry()
+        if (
+            type not in registry
+            and self._manifest is not None
+            and type in self._manifest["types"]
+        ):
+            importlib.import_module(self._manifest["types"][type]["module"])
+        return registry[type]
 
     def values(self):
         """Returns all the created objects"""
@@ -849,7 +1122,7 @@ class RegistryLoader:
     def create(self, type, id=None, *args, **kwargs):
         """Loads and creates a object from the registry by type"""
 
-        if type not in self._cls.registry():
+        if type not in self.types():
             raise AttributeError(
                 ("Couldn't find '{}' in the {} registry").format(
                     type, self._cls.__name__.lower()
@@ -867,10 +1140,10 @@ class RegistryLoader:
 
         # Create the new object based on the registry entires and
         # validate the schema.
-        _cls = self._cls.registry().get(type)
+        _cls = self.get_class(type)
         _config = kwargs.pop("config", None)
         if _config is not None:
-            _config = _cls.schema()(_config)
+            _config = _cls.validate_config(_config)
             obj = _cls(config=_config, *args, **kwargs)
         else:
             obj = _cls(*args, **kwargs)
@@ -7,6 +7,7 @@ import numpy as np
 import voluptuous as vol
 import zeroconf
 
+from ledfx.config import save_config
 from ledfx.effects import DummyEffect
 from ledfx.effects.math import interpolate_pixels
 from ledfx.effects.melbank import (
@@ -26,6 +27,7 @@ from ledfx.events import (
 )
 
 # from ledfx.config import save_config
+from ledfx.presets import get_presets
 from ledfx.transitions import Transitions
 from ledfx.utils import fps_to_sleep_interval
 
@@ -77,6 +79,21 @@ class Virtual:
                 description="Type of transition between effects",
                 default="Add",
             ): vol.In([mode for mode in Transitions]),
+            vol.Optional(
+                "rows",
+                description="Number of rows if the virtual is a matrix, 1 for a strip",
+                default=1,
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                "matrix_layout",
+                description="Row-major: every row runs left to right. Serpentine: every other row runs right to left",
+                default="row-major",
+            ): vol.In(["row-major", "serpentine"]),
+            vol.Optional(
+                "render_process",
+                description="Render effects in a worker process, for CPU heavy effects on hosts with many cores",
+                default=False,
+            ): bool,
             vol.Optional(
                 "frequency_min",
                 description="Lowest frequency for this virtual's audio reactive effects",
@@ -202,6 +219,8 @@ class Virtual:
             "refresh_rate",
             "_devices",
             "_segments_by_device",
+            "matrix_shape",
+            "matrix_index",
         ]:
             if hasattr(self, prop):
                 delattr(self, prop)
@@ -250,9 +269,8 @@ class Virtual:
 
         # Create the effect and add it to the virtual
         try:
-            effect_config = self._ledfx.config[category][effect_id][preset_id][
-                "config"
-            ]
+            presets = get_presets(self._ledfx.config, category)
+            effect_config = presets[effect_id][preset_id]["config"]
         except KeyError:
             _LOGGER.error(f"Cannot find preset: {preset_info}")
             return
@@ -262,11 +280,27 @@ class Virtual:
         self.set_effect(effect)
 
     def set_effect(self, effect):
+        self.commit_effect(self.prepare_effect(effect))
+
+    def prepare_effect(self, effect):
+        """
+        Activates an effect for this virtual without showing it yet, so that
+        a scene can prepare all of its effects before switching any of them.
+        Returns the effect to pass to commit_effect.
+        """
         if not self._devices:
             error = f"Virtual {self.id}: Cannot activate, no configured device segments"
             _LOGGER.warning(error)
             raise ValueError(error)
 
+        if self._config["render_process"]:
+            effect = self._ledfx.render_pool.wrap(effect)
+
+        effect.activate(self)
+        return effect
+
+    def commit_effect(self, effect):
+        """Shows a prepared effect from the next frame on"""
         if (
             self._config["transition_mode"] != "None"
             and self._config["transition_time"] > 0
@@ -285,7 +319,6 @@ class Virtual:
             self.clear_transition_effect()
 
         self._active_effect = effect
-        self._active_effect.activate(self)
         self._ledfx.events.fire_event(
             EffectSetEvent(
                 self._active_effect.name,
@@ -301,6 +334,41 @@ class Virtual:
             self.active = False
             raise
 
+    def set_effect_parameters(self, parameters):
+        """
+        Sets live numeric parameters of the active effect, checking only
+        their ranges. They show from the next frame on and are saved in the
+        next coalesced config write. Returns the coerced parameters.
+        """
+        effect = self._active_effect
+        if effect is None or not hasattr(effect, "set_parameters"):
+            raise ValueError(f"Virtual {self.id} has no active effect")
+        parameters = effect.set_parameters(parameters)
+
+        virtual_config = next(
+            (
+                item
+                for item in self._ledfx.config["virtuals"]
+                if item["id"] == self.id
+            ),
+            None,
+        )
+        if virtual_config is not None:
+            for effect_config in (
+                virtual_config.get("effect"),
+                virtual_config.get("effects", {}).get(effect.type),
+            ):
+                if effect_config and effect_config.get("type") == effect.type:
+                    effect_config["config"] = {
+                        **effect_config["config"],
+                        **parameters,
+                    }
+            save_config(
+                config=self._ledfx.config,
+                config_dir=self._ledfx.config_dir,
+            )
+        return parameters
+
     def transition_to_active(self):
         self._active_effect = self._transition_effect
         self._transition_effect = None
@@ -373,9 +441,12 @@ class Virtual:
                         # )
                         self.flush()
 
-                    self._ledfx.events.fire_event(
-                        VirtualUpdateEvent(self.id, self.assembled_frame)
-                    )
+                    if self._ledfx.events.has_listeners(
+                        Event.VIRTUAL_UPDATE, virtual_id=self.id
+                    ):
+                        self._ledfx.events.fire_event(
+                            VirtualUpdateEvent(self.id, self.assembled_frame)
+                        )
 
             time.sleep(fps_to_sleep_interval(self.refresh_rate))
 
@@ -383,9 +454,11 @@ class Virtual:
         """
         Assembles the frame to be flushed.
         """
-        # Get and process active effect frame
-        self._active_effect._render()
-        frame = self._active_effect.get_pixels()
+        # Get and process active effect frame. The effect is read once, so a
+        # newly committed effect only takes over at the next frame
+        effect = self._active_effect
+        effect._render()
+        frame = effect.get_pixels()
         if frame is None:
             return
         frame[frame > 255] = 255
@@ -624,6 +697,27 @@ class Virtual:
             else:
                 return 0
 
+    @cached_property
+    def matrix_shape(self):
+        """
+        (height, width) of the virtual as a matrix. Strips are a single row.
+        The last row may be partially filled.
+        """
+        rows = self._config["rows"]
+        return rows, -(-self.pixel_count // rows)
+
+    @cached_property
+    def matrix_index(self):
+        """
+        Flat index into a row-major (height, width) matrix for each pixel of
+        the virtual, following the configured matrix layout
+        """
+        height, width = self.matrix_shape
+        index = np.arange(height * width).reshape(height, width)
+        if self._config["matrix_layout"] == "serpentine":
+            index[1::2] = index[1::2, ::-1]
+        return index.ravel()[: self.pixel_count]
+
     @staticmethod
     def schema() -> vol.Schema:
         """returns the schema for the object"""
@@ -648,7 +742,11 @@ class Virtual:
         _config = self.CONFIG_SCHEMA(_config)
 
         if hasattr(self, "_config"):
-            if _config["mapping"] != self._config["mapping"]:
+            if (
+                _config["mapping"] != self._config["mapping"]
+                or _config["rows"] != self._config["rows"]
+                or _config["matrix_layout"] != self._config["matrix_layout"]
+            ):
                 self.invalidate_cached_props()
             if (
                 _config["transition_mode"] != self._config["transition_mode"]